@@ -1,6 +1,6 @@
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+from fastapi import Request, Security
+from fastapi.responses import JSONResponse
+from fastapi.security import APIKeyHeader
 import os
 import logging
 import secrets
@@ -9,34 +9,39 @@ logger = logging.getLogger("sonora.security")
 
 API_KEY_NAME = "X-Sonora-Key"
 
-class SonoraAuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        # 1. Whitelist Health Checks and Docs
-        if request.url.path in ["/health", "/docs", "/openapi.json", "/"]:
-            return await call_next(request)
-        
-        # 2. Whitelist WebSocket
-        if "ws" in request.url.path:
-             return await call_next(request)
-
-        # 3. Check for API Key with fallback and stripping
-        expected_key = os.getenv("SONORA_API_KEY", "admin123").strip()
-        client_key = request.headers.get(API_KEY_NAME, "").strip()
-        
+# Resolved once at import (server.py loads .env first); hardened to 'admin123' when unset or empty
+_EXPECTED_KEY = os.getenv("SONORA_API_KEY", "admin123").strip()
+if not _EXPECTED_KEY:
+    logger.warning("SECURITY ALERT: SONORA_API_KEY is empty. Hardening to 'admin123'.")
+    _EXPECTED_KEY = "admin123"
+
+# Same 403 body the old middleware returned, so existing clients keep their diagnostics
+BLOCKED_CONTENT = {
+    "detail": "Sonora Security Block: Invalid or Missing API Key",
+    "required_header": API_KEY_NAME,
+    "debug_hint": "Check SONORA_API_KEY in .env and Ensure UI/API are synced."
+}
+
+class APIKeyBlocked(Exception):
+    """Raised by require_api_key; rendered by api_key_blocked_handler."""
+
+async def api_key_blocked_handler(request: Request, exc: APIKeyBlocked):
+    return JSONResponse(
+        status_code=403,
+        content=BLOCKED_CONTENT,
+        headers={"X-Required-Header": API_KEY_NAME},
+    )
+
+# auto_error=False so a missing header gets the same 403 as a wrong one
+api_key_header = APIKeyHeader(name=API_KEY_NAME, auto_error=False)
+
+async def require_api_key(client_key: str = Security(api_key_header)):
+    """
+    Route-level API-key guard. Attached to the /api router only, so health checks,
+    docs and WebSockets never run it, and OpenAPI documents the scheme.
+    """
+    client_key = (client_key or "").strip()
+    if not secrets.compare_digest(client_key.encode("latin-1", "replace"), _EXPECTED_KEY.encode("latin-1")):
         # Diagnostic Log (Masked)
-        if not expected_key:
-             logger.warning("SECURITY ALERT: SONORA_API_KEY is empty. Hardening to 'admin123'.")
-             expected_key = "admin123"
-
-        if not secrets.compare_digest(client_key, expected_key):
-            logger.warning(f"SECURITY BLOCK: Unauthorized access attempt. Expected starts with {expected_key[:2]}..., got {client_key[:2]}...")
-            return JSONResponse(
-                status_code=403, 
-                content={
-                    "detail": "Sonora Security Block: Invalid or Missing API Key",
-                    "required_header": API_KEY_NAME,
-                    "debug_hint": "Check SONORA_API_KEY in .env and Ensure UI/API are synced."
-                }
-            )
-            
-        return await call_next(request)
+        logger.warning(f"SECURITY BLOCK: Unauthorized access attempt. Expected starts with {_EXPECTED_KEY[:2]}..., got {client_key[:2]}...")
+        raise APIKeyBlocked()
@@ -1,12 +1,17 @@
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, UploadFile, File, Body
+from fastapi import FastAPI, APIRouter, Security, WebSocket, WebSocketDisconnect, HTTPException, UploadFile, File, Body
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Dict, Optional
 import json
+import orjson
 import asyncio
+import functools
 import os
-import sys
+import shutil
+import time
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Load environment variables at startup (force override)
@@ -15,18 +20,59 @@ print(f"[INIT] CLOUD_OFFLOAD: {os.getenv('CLOUD_OFFLOAD')}")
 
 logger = logging.getLogger("sonora.api")
 
-# Ensure project root is in path
-sys.path.append(os.getcwd())
-
 from sonora.core.project_manager import SonoraProject
-from sonora.core.orchestrator import SonoraOrchestrator, group_words_by_pause, count_syllables, estimate_japanese_morae
+from sonora.core.orchestrator import SonoraOrchestrator, group_words_by_pause, segment_text, count_syllables, estimate_japanese_morae, get_http_client, close_http_client
 from sonora.utils.voice_registry import save_character_voice
-from api.auth import SonoraAuthMiddleware
+from api.auth import APIKeyBlocked, api_key_blocked_handler, require_api_key
 # Segmenter service URL (new dedicated segmentation microservice)
 SEGMENTER_URL = os.getenv("SEGMENTER_URL", "http://127.0.0.1:8004")
 
 app = FastAPI(title="Sonora AI Studio API")
 
+# Concurrent jobs allowed to drive the shared orchestrator's GPU-bound engines
+ORCH_SLOTS = asyncio.Semaphore(int(os.getenv("SONORA_GPU_SLOTS", "2")))
+
+@app.on_event("startup")
+async def warm_orchestrator():
+    """Load the orchestrator engines once so requests never pay model init."""
+    try:
+        orch = await asyncio.to_thread(SonoraOrchestrator, None)
+    except Exception as e:
+        # Keep serving /health: app.state.orch stays unset, so get_orchestrator() retries per request
+        logger.error(f"Orchestrator warm-up failed, deferring engine init to the first request: {e}")
+        return
+    app.state.orch = orch
+    # Shared translator; one dummy inference primes the local model before the first /api/dub
+    app.state.translator = orch.translator
+    await asyncio.to_thread(orch.translator.warmup)
+
+@app.on_event("startup")
+async def init_io_pool():
+    """Dedicated pool for blocking disk writes so they don't contend with the default executor."""
+    app.state.io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sonora-io")
+
+@app.on_event("shutdown")
+async def close_io_pool():
+    pool = getattr(app.state, "io_pool", None)
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+@app.on_event("shutdown")
+async def close_outbound_pool():
+    await close_http_client()
+
+async def run_io(func, *args):
+    """Runs a blocking filesystem call on the I/O pool instead of the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(getattr(app.state, "io_pool", None), functools.partial(func, *args))
+
+def get_orchestrator(audio_path: Optional[str] = None) -> SonoraOrchestrator:
+    """Returns a per-request view of the shared orchestrator bound to audio_path."""
+    orch = getattr(app.state, "orch", None)
+    if orch is None:
+        orch = app.state.orch = SonoraOrchestrator(None)
+    return orch.bind(audio_path)
+
 # --- Request Models ---
 class SegmentRequest(BaseModel):
     video_path: str
@@ -44,37 +90,70 @@ class TranslateRequest(BaseModel):
     segments: List[Dict]
     style: Optional[str] = "Anime"
 
-# CORS
+# CORS: concrete allowlist (auth is a custom header, not cookies, so no credentials)
+ALLOWED_ORIGINS = tuple(
+    o.strip() for o in os.getenv(
+        "SONORA_ALLOWED_ORIGINS",
+        "http://localhost:3000,http://127.0.0.1:3000,http://localhost:8501,http://127.0.0.1:8501"
+    ).split(",") if o.strip()
+)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=ALLOWED_ORIGINS,
+    allow_methods=("GET", "POST"),
+    allow_headers=("X-Sonora-Key", "Content-Type"),
 )
 
-# Auth Middleware
-app.add_middleware(SonoraAuthMiddleware)
+# Auth: every /api route requires X-Sonora-Key; /health and /ws stay open
+api_router = APIRouter(dependencies=[Security(require_api_key)])
+app.add_exception_handler(APIKeyBlocked, api_key_blocked_handler)
 
 # --- WebSocket Manager ---
+CLIENT_QUEUE_SIZE = 256
+
 class ConnectionManager:
+    """Pub/sub fan-out: broadcast enqueues one pre-serialized payload per client and
+    a dedicated writer task per socket drains it, so a slow tab never stalls the producer."""
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self.active_connections[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket, queue))
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        try:
+            while True:
+                await websocket.send_text(await queue.get())
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.disconnect(websocket)
+
+    def _publish(self, queue: asyncio.Queue, payload: str):
+        if queue.full():
+            queue.get_nowait() # Drop oldest: stale status lines are worthless
+        queue.put_nowait(payload)
+
+    async def send_personal(self, websocket: WebSocket, message: dict):
+        queue = self.active_connections.get(websocket)
+        if queue is not None:
+            self._publish(queue, orjson.dumps(message).decode())
 
     async def broadcast(self, message: dict):
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except:
-                pass
+        # Text frames: the browser client JSON.parses event.data
+        payload = orjson.dumps(message).decode()
+        for queue in self.active_connections.values():
+            self._publish(queue, payload)
 
 manager = ConnectionManager()
 
@@ -103,7 +182,7 @@ class SynthesizeRequest(BaseModel):
 async def health_check():
     return {"status": "ok", "service": "sonora-backend", "mode": "swarm_intelligence"}
 
-@app.get("/api/swarm/status")
+@api_router.get("/api/swarm/status")
 async def get_swarm_status():
     from src.core.shadow_providers import check_swarm_health
     # Run in thread pool as it performs network I/O
@@ -117,6 +196,12 @@ from src.core.path_manager import SHARED_ROOT
 SHARED_PATH = str(SHARED_ROOT)
 JOBS_FILE = os.path.join(SHARED_PATH, "jobs.json")
 analysis_jobs = {}
+UPLOAD_DIR = SHARED_PATH
+
+@app.on_event("startup")
+async def prepare_upload_dir():
+    """Create the upload dir once so /api/analyze never stats it per request."""
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 def save_jobs():
     try:
@@ -227,14 +312,14 @@ async def background_segmentation(job_id: str, video_path: str, language: str =
         }
 
         try:
-            async with httpx.AsyncClient(timeout=600.0) as client:
-                response = await client.post(segment_url, json=payload)
+            client = get_http_client()
+            response = await client.post(segment_url, json=payload, timeout=600.0)
 
-                if response.status_code != 200:
-                    raise Exception(f"Segmenter service returned error {response.status_code}: {response.text}")
+            if response.status_code != 200:
+                raise Exception(f"Segmenter service returned error {response.status_code}: {response.text}")
 
-                data = response.json()
-                segmenter_job_id = data.get("job_id")
+            data = response.json()
+            segmenter_job_id = data.get("job_id")
         except httpx.ConnectError:
             raise Exception(
                 f"Segmenter service not reachable at {SEGMENTER_URL}. "
@@ -250,55 +335,54 @@ async def background_segmentation(job_id: str, video_path: str, language: str =
             await asyncio.sleep(5)
             poll_count += 1
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                poll_response = await client.get(poll_url)
-                if poll_response.status_code != 200:
-                    logger.warning(f"Polling segmenter failed: {poll_response.status_code} {poll_response.text}")
-                    continue
-
-                poll_data = poll_response.json()
-                status = poll_data.get("status", "")
-                progress = poll_data.get("progress", 0)
-
-                # Broadcast progress AND persist to analysis_jobs for REST pollers
-                if status not in ["Complete", "Error", ""]:
-                    analysis_jobs[job_id]["status"] = status
-                    analysis_jobs[job_id]["progress"] = progress
-                    save_jobs()
-                    await manager.broadcast({
-                        "type": "status",
-                        "msg": f"Segmenting: {status} ({progress:.0%})",
-                        "job_id": job_id,
-                        "progress": progress
-                    })
-                elif status == "Complete":
-                    result = poll_data.get("result", {})
-                    segments = result.get("segments", [])
-
-                    analysis_jobs[job_id]["status"] = "Complete"
-                    analysis_jobs[job_id]["result"] = {
-                        "segments": segments,
-                        "num_speakers": result.get("num_speakers", 0),
-                        "duration": result.get("duration", 0),
-                        "language": result.get("language", language),
-                        "mode": result.get("mode", mode),
-                        "processing_time": result.get("processing_time", 0)
-                    }
-                    save_jobs()
-
-                    await manager.broadcast({
-                        "type": "status",
-                        "msg": f"Segmentation Complete: {len(segments)} segments, "
-                               f"{result.get('num_speakers', 0)} speakers.",
-                        "success": True,
-                        "job_id": job_id,
-                        "segments_count": len(segments)
-                    })
-                    return
-
-                elif status == "Error":
-                    error_msg = poll_data.get("error", "Unknown segmentation error")
-                    raise Exception(error_msg)
+            poll_response = await client.get(poll_url, timeout=30.0)
+            if poll_response.status_code != 200:
+                logger.warning(f"Polling segmenter failed: {poll_response.status_code} {poll_response.text}")
+                continue
+
+            poll_data = poll_response.json()
+            status = poll_data.get("status", "")
+            progress = poll_data.get("progress", 0)
+
+            # Broadcast progress AND persist to analysis_jobs for REST pollers
+            if status not in ["Complete", "Error", ""]:
+                analysis_jobs[job_id]["status"] = status
+                analysis_jobs[job_id]["progress"] = progress
+                save_jobs()
+                await manager.broadcast({
+                    "type": "status",
+                    "msg": f"Segmenting: {status} ({progress:.0%})",
+                    "job_id": job_id,
+                    "progress": progress
+                })
+            elif status == "Complete":
+                result = poll_data.get("result", {})
+                segments = result.get("segments", [])
+
+                analysis_jobs[job_id]["status"] = "Complete"
+                analysis_jobs[job_id]["result"] = {
+                    "segments": segments,
+                    "num_speakers": result.get("num_speakers", 0),
+                    "duration": result.get("duration", 0),
+                    "language": result.get("language", language),
+                    "mode": result.get("mode", mode),
+                    "processing_time": result.get("processing_time", 0)
+                }
+                save_jobs()
+
+                await manager.broadcast({
+                    "type": "status",
+                    "msg": f"Segmentation Complete: {len(segments)} segments, "
+                           f"{result.get('num_speakers', 0)} speakers.",
+                    "success": True,
+                    "job_id": job_id,
+                    "segments_count": len(segments)
+                })
+                return
+
+            elif status == "Error":
+                error_msg = poll_data.get("error", "Unknown segmentation error")
+                raise Exception(error_msg)
         raise Exception("Segmentation timed out after 45 minutes")
 
     except Exception as e:
@@ -310,7 +394,7 @@ async def background_segmentation(job_id: str, video_path: str, language: str =
         save_jobs()
         await manager.broadcast({"type": "status", "msg": f"Segmentation Failed: {str(e)}", "error": True, "job_id": job_id})
 
-@app.post("/api/pipeline/segment")
+@api_router.post("/api/pipeline/segment")
 async def pipeline_segment(background_tasks: BackgroundTasks, req: SegmentRequest):
     """
     Trigger the full segmentation pipeline via the dedicated Segmenter service.
@@ -345,13 +429,13 @@ async def pipeline_segment(background_tasks: BackgroundTasks, req: SegmentReques
     )
     return {"job_id": job_id, "status": "Segmentation Queued", "mode": req.mode, "aligner": req.aligner}
 
-@app.post("/api/pipeline/translate")
+@api_router.post("/api/pipeline/translate")
 async def pipeline_translate(req: TranslateRequest):
     """
     Translates a list of segments using high-speed neural link.
     """
     try:
-        orch = SonoraOrchestrator("dummy.mp4")
+        orch = get_orchestrator()
         segments_for_orch = []
         for s in req.segments:
             if "words" in s:
@@ -374,15 +458,36 @@ async def pipeline_translate(req: TranslateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 # --- Original Analysis Logic ---
-async def background_analysis(job_id: str, file_path: str, filename: str):
+PROGRESS_INTERVAL = 0.1  # seconds between coalesced progress broadcasts
+
+def _format_segment(i: int, seg: List[Dict], original_text: str, translated_text: str) -> Optional[Dict]:
+    """Builds the studio row for one translated segment, or None for AI-flagged noise."""
+    # Skip noise/breath lines marked by the AI (Phase 2 Surgical Hygiene)
+    if translated_text.upper() == "[EXTRANEOUS]":
+        logger.info(f"✨ [HYGIENE] Purging noise segment {i}: '{original_text[:20]}...'")
+        return None
+
+    return {
+        "id": str(i),
+        "start": seg[0]['start'],
+        "end": seg[-1]['end'],
+        "original": original_text,
+        "translation": translated_text,
+        "targetFlaps": estimate_japanese_morae(original_text),
+        "currentFlaps": count_syllables(translated_text),
+        "speaker": seg[0].get('speaker', 'UNKNOWN'),
+        "words": seg
+    }
+
+async def _run_analysis(job_id: str, file_path: str, filename: str):
     async def update_job_status(msg: str):
         analysis_jobs[job_id]["status"] = msg
         save_jobs()
         await manager.broadcast({"type": "status", "msg": msg, "job_id": job_id})
 
     try:
-        # Initialize orchestrator with the uploaded file path
-        orch = SonoraOrchestrator(file_path)
+        # Bind the shared orchestrator to the uploaded file path
+        orch = get_orchestrator(file_path)
         
         # 1. STEM SEPARATION
         await update_job_status("Neural Separation: Isolating stems (Demucs v4 Surgery)...")
@@ -409,31 +514,37 @@ async def background_analysis(job_id: str, file_path: str, filename: str):
         
         # 3. TRANSLATION
         await update_job_status("Neural Link: Translating content...")
-        translations = await orch.translate_segments_batch(segments_raw)
-        
-        formatted_segments = []
-        for i, seg in enumerate(segments_raw):
-            original_text = " ".join([w.get('word', '') for w in seg])
-            translated_text = translations[i] if i < len(translations) else "[ERROR]"
-            
-            # Skip noise/breath lines marked by the AI (Phase 2 Surgical Hygiene)
-            if translated_text.upper() == "[EXTRANEOUS]":
-                logger.info(f"✨ [HYGIENE] Purging noise segment {i}: '{original_text[:20]}...'")
-                continue
-            
-            target_syllables = estimate_japanese_morae(original_text)
-            
-            formatted_segments.append({
-                "id": str(i),
-                "start": seg[0]['start'],
-                "end": seg[-1]['end'],
-                "original": original_text,
-                "translation": translated_text,
-                "targetFlaps": target_syllables, 
-                "currentFlaps": count_syllables(translated_text),
-                "speaker": seg[0].get('speaker', 'UNKNOWN'),
-                "words": seg
-            })
+        # Join each segment's words once; reused for the prompts and the formatted output
+        segment_texts = [segment_text(seg) for seg in segments_raw]
+        formatted_by_index = {}
+        total = len(segments_raw)
+        translated = 0
+        last_progress = 0.0
+
+        async def publish_batch(offset: int, batch_translations: List[str]):
+            nonlocal translated, last_progress
+            # Push finished lines to the studio as each batch lands instead of after the whole episode
+            ready = []
+            for j, translated_text in enumerate(batch_translations):
+                i = offset + j
+                formatted = _format_segment(i, segments_raw[i], segment_texts[i], translated_text)
+                if formatted is not None:
+                    formatted_by_index[i] = formatted
+                    ready.append(formatted)
+            if ready:
+                await manager.broadcast({"type": "segment", "job_id": job_id, "segments": ready})
+
+            # Coalesced progress: at most one message per PROGRESS_INTERVAL, plus the final one
+            translated += len(batch_translations)
+            now = time.monotonic()
+            if translated == total or now - last_progress >= PROGRESS_INTERVAL:
+                last_progress = now
+                analysis_jobs[job_id]["progress"] = translated / total
+                await manager.broadcast({"type": "progress", "job_id": job_id, "done": translated, "total": total})
+
+        await orch.translate_segments_batch(segments_raw, texts=segment_texts, on_batch=publish_batch)
+        # Batches may finish out of order; the stored result stays in timeline order
+        formatted_segments = [formatted_by_index[i] for i in sorted(formatted_by_index)]
             
         analysis_jobs[job_id]["status"] = "Complete"
         analysis_jobs[job_id]["result"] = {
@@ -459,19 +570,26 @@ async def background_analysis(job_id: str, file_path: str, filename: str):
         save_jobs()
         await manager.broadcast({"type": "status", "msg": error_msg, "error": True, "job_id": job_id})
 
-@app.post("/api/analyze")
+async def background_analysis(job_id: str, file_path: str, filename: str):
+    """Runs one analysis job while holding a GPU slot on the shared orchestrator."""
+    async with ORCH_SLOTS:
+        await _run_analysis(job_id, file_path, filename)
+
+def _stream_upload(file: UploadFile, dest_path: str, chunk_size: int = 1 << 20):
+    """Copies an upload to disk in 1MB chunks so peak memory stays flat for large episodes."""
+    with open(dest_path, "wb") as buffer:
+        shutil.copyfileobj(file.file, buffer, chunk_size)
+
+@api_router.post("/api/analyze")
 async def analyze_media(background_tasks: BackgroundTasks, file: UploadFile = File(...)):
     job_id = str(uuid.uuid4())
-    temp_dir = SHARED_PATH
-    os.makedirs(temp_dir, exist_ok=True)
     
-    # Safe filename relative to SHARED_PATH (prevent collisions)
-    clean_filename = file.filename.replace('/', '_').replace('\\', '_')
+    # Safe filename relative to UPLOAD_DIR: basename only (no traversal), job_id prefix (no collisions)
+    clean_filename = os.path.basename((file.filename or "upload").replace('\\', '/')) or "upload"
     safe_filename = f"{job_id}_{clean_filename}"
-    file_path = os.path.join(temp_dir, safe_filename)
+    file_path = os.path.join(UPLOAD_DIR, safe_filename)
     
-    with open(file_path, "wb") as buffer:
-        buffer.write(await file.read())
+    await run_io(_stream_upload, file, file_path)
         
     analysis_jobs[job_id] = {
         "status": "Starting...",
@@ -484,58 +602,90 @@ async def analyze_media(background_tasks: BackgroundTasks, file: UploadFile = Fi
     background_tasks.add_task(background_analysis, job_id, file_path, safe_filename)
     return {"job_id": job_id, "status": "Queued"}
 
-@app.get("/api/job/{job_id}")
+@api_router.get("/api/job/{job_id}")
 async def get_job_status(job_id: str):
     load_jobs() # Refresh from disk for cross-worker/restart consistency
     if job_id not in analysis_jobs:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found in vault")
     return analysis_jobs[job_id]
 
-@app.post("/api/refactor")
+# --- Refactor Response Cache ---
+# The editor re-requests the same line with the same knobs while users tweak neighbours.
+REFACTOR_CACHE_SIZE = 4096
+REFACTOR_CACHE_TTL = 3600  # seconds
+_refactor_cache: "OrderedDict[tuple, tuple]" = OrderedDict()  # key -> (expires_at, response)
+
+def _refactor_cache_get(key: tuple) -> Optional[Dict]:
+    entry = _refactor_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, response = entry
+    if expires_at < time.monotonic():
+        del _refactor_cache[key]
+        return None
+    _refactor_cache.move_to_end(key)
+    return response
+
+def _refactor_cache_put(key: tuple, response: Dict):
+    _refactor_cache[key] = (time.monotonic() + REFACTOR_CACHE_TTL, response)
+    _refactor_cache.move_to_end(key)
+    while len(_refactor_cache) > REFACTOR_CACHE_SIZE:
+        _refactor_cache.popitem(last=False)
+
+@api_router.post("/api/refactor")
 async def refactor_segment(req: RefactorRequest):
     """Surgical Rewrite: Now supports Gemini 3 Flash."""
     logger.info(f"Refactor request for: '{req.text[:50]}...' Target syllables: {req.target_syllables}")
+    cache_key = (req.text, req.target_syllables, req.style, req.engine)
+    cached = _refactor_cache_get(cache_key)
+    if cached is not None:
+        return cached
     try:
-        orch = SonoraOrchestrator("dummy.mp4") 
+        orch = get_orchestrator()
         result = await orch.refactor_line(req.text, req.target_syllables, req.style)
         new_text = result.get("text", "")
         provider = result.get("provider", "unknown")
         logger.info(f"Refactored result: '{new_text[:50]}...' (Engine: {provider})")
-        return {"text": new_text, "engine": provider}
+        response = {"text": new_text, "engine": provider}
+        # Never pin a failed/rate-limited answer for an hour
+        if provider != "error":
+            _refactor_cache_put(cache_key, response)
+        return response
     except Exception as e:
         logger.error(f"Refactor failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/api/registry/save")
+@api_router.post("/api/registry/save")
 async def save_to_registry(req: RegistrySaveRequest):
     """Locks a character voice profile into the production asset vault."""
     try:
-        success = save_character_voice(req.character_name, req.audio_path, req.metadata)
+        success = await run_io(save_character_voice, req.character_name, req.audio_path, req.metadata)
         if success:
             return {"status": "success", "msg": f"Character {req.character_name} asset locked."}
         raise Exception("Registry Write Failed")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/projects")
+@api_router.get("/api/projects")
 async def list_projects():
     # Return real projects plus a few demo ones if directory is empty
     projs = SonoraProject.list_projects("sonora/data")
     return {"projects": projs or ["NEO_TOKYO_PILOT", "SHIBUYA_INCIDENT_DUB"]}
 
-@app.post("/api/synthesize")
+@api_router.post("/api/synthesize")
 async def synthesize_dub(req: SynthesizeRequest):
     """The Final Assembly: Neural Synthesis + Master Mix."""
     try:
         await manager.broadcast({"type": "status", "msg": "Neural Synthesis: Generating AI performance..."})
-        orch = SonoraOrchestrator(req.video_path)
+        orch = get_orchestrator(req.video_path)
         
-        # 1. Synthesis Pass
-        takes = await orch.synthesize_segments(req.segments, req.translations, req.voice_id)
-        
-        # 2. Master Assembly Pass
-        await manager.broadcast({"type": "status", "msg": "Master Continuity: Muxing with world track..."})
-        master_path = await orch.assemble_final_dub(req.video_path, takes, req.segments, stems=req.stems)
+        async with ORCH_SLOTS:
+            # 1. Synthesis Pass
+            takes = await orch.synthesize_segments(req.segments, req.translations, req.voice_id)
+            
+            # 2. Master Assembly Pass
+            await manager.broadcast({"type": "status", "msg": "Master Continuity: Muxing with world track..."})
+            master_path = await orch.assemble_final_dub(req.video_path, takes, req.segments, stems=req.stems)
         
         await manager.broadcast({"type": "status", "msg": "Dubbing Complete!", "success": True})
         return {"master_path": master_path}
@@ -551,10 +701,25 @@ async def websocket_endpoint(websocket: WebSocket):
     try:
         while True:
             await websocket.receive_text()
-            await websocket.send_json({"type": "ack", "msg": "Sync Active"})
+            await manager.send_personal(websocket, {"type": "ack", "msg": "Sync Active"})
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
+# Register the key-protected routes (must follow every @api_router definition)
+app.include_router(api_router)
+
 if __name__ == "__main__":
+    # Start with `python -m api.server` from the repo root, or `pip install -e .` first:
+    # there is no sys.path patching here, so `python api/server.py` can't resolve sonora.
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # uvloop + httptools ship with uvicorn[standard]; uvloop has no Windows build.
+    # NOTE: with SONORA_WORKERS > 1 the /ws/status fan-out, orchestrator and refactor
+    # cache are per-worker; job state is shared through jobs.json.
+    uvicorn.run(
+        "api.server:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if os.name == "nt" else "uvloop",
+        http="httptools",
+        workers=int(os.getenv("SONORA_WORKERS", "1")),
+    )
\ No newline at end of file
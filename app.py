@@ -1,43 +1,104 @@
 import streamlit as st
-import requests, os, time, json
+import requests, os, time, json, functools, mmap, threading
 from streamlit.components.v1 import html
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Try to import visualization libraries
-try:
-    import plotly.graph_objects as go
-    import plotly.express as px
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
+# Visualization libraries are imported on first use (once per process); None when not installed
+@functools.lru_cache(maxsize=1)
+def _plotly_go():
+    try:
+        import plotly.graph_objects as go
+        return go
+    except ImportError:
+        return None
 
+@functools.lru_cache(maxsize=1)
+def _pil_image():
+    try:
+        from PIL import Image
+        return Image
+    except ImportError:
+        return None
+
+# Prefer orjson for report parsing and status dumps
 try:
-    from PIL import Image
-    PIL_AVAILABLE = True
+    import orjson
+    json_loads = orjson.loads
+    def json_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
 except ImportError:
-    PIL_AVAILABLE = False
+    json_loads = json.loads
+    def json_pretty(obj):
+        return json.dumps(obj, indent=2)
 
 API_BASE = os.getenv("API_BASE", "http://localhost:8000")
 WS_BASE = os.getenv("WS_BASE", "ws://localhost:8000")
 
+# Static UI options (built once per process, not on every rerun)
+TTS_PROVIDERS = ("VibeVoice", "ElevenLabs")
+EMOTIONS = ("neutral", "happy", "sad", "angry", "excited", "calm")
+TONES = ("normal", "high", "low", "whisper", "shout")
+TARGET_LANGUAGES = ("en", "ja", "ko", "zh", "es", "fr", "de")
+VOICE_CHARACTERS = ("anime_female_01", "anime_male_01", "anime_female_mature")
+LIP_SYNC_MODELS = ("auto", "wav2lip", "sadtalker", "real_esrgan")
+QUALITY_MODES = ("fast", "balanced", "high_quality")
+TTS_STATUS = (
+    ("VibeVoice", "🟢 Active"),
+    ("ElevenLabs", "🟡 Fallback"),
+    ("Mock TTS", "🟢 Available"),
+)
+LIPSYNC_STATUS = (
+    ("Wav2Lip", "🟢 Available"),
+    ("SadTalker", "🟡 GPU Required"),
+    ("Real-ESRGAN", "🔴 Not Installed"),
+    ("Mock Mode", "🟢 Always Available"),
+)
+
 st.set_page_config(page_title="Sonora Dashboard", layout="wide")
 
+# One keep-alive session per browser session, so backend calls reuse their sockets
+if "http" not in st.session_state:
+    _session = requests.Session()
+    _adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.1))
+    _session.mount("http://", _adapter)
+    _session.mount("https://", _adapter)
+    st.session_state.http = _session
+http = st.session_state.http
+
 # Add health check and auto-reconnect JS
 st.markdown("""
 <script>
+// Poll only while the tab is visible; back off (with jitter) while the backend is unreachable
+const HEALTH_BASE_MS = 3000, HEALTH_MAX_MS = 30000;
+let healthDelay = HEALTH_BASE_MS, healthTimer = null;
+function scheduleHealth(){
+  clearTimeout(healthTimer);
+  if (document.visibilityState !== 'visible') return;
+  healthTimer = setTimeout(checkHealth, healthDelay * (0.8 + Math.random() * 0.4));
+}
 function checkHealth(){
   fetch('/api/health').then(r => {
     if (!r.ok) {
       console.warn("Backend not healthy, reloading in 1s.");
       setTimeout(()=>location.reload(), 1000);
+      return;
     }
+    healthDelay = HEALTH_BASE_MS;
+    scheduleHealth();
   }).catch(e => {
-    console.warn("Health check failed, reload schedule");
-    setTimeout(()=>location.reload(), 1500);
+    console.warn("Health check failed, backing off");
+    healthDelay = Math.min(healthDelay * 2, HEALTH_MAX_MS);
+    scheduleHealth();
   });
 }
-setInterval(checkHealth, 3000);
+document.addEventListener('visibilitychange', scheduleHealth);
+scheduleHealth();
 </script>
 """, unsafe_allow_html=True)
 
@@ -75,20 +136,54 @@ ws.onmessage = (evt) => {{
 # This HTML will open a WS. Using Streamlit's html + window.postMessage we can read via st_js_events or other component.
 html(ws_js, height=1)
 
-# Simple polling fallback
+# Real-time job progress: opens the session WebSocket returned by /api/dub/video and
+# updates the bar in place on each message (also forwarded to the parent as SONORA_PROGRESS)
+PROGRESS_JS_TEMPLATE = """
+<div style="font-family:sans-serif;font-size:14px">
+  <div style="background:#eee;border-radius:4px;height:10px"><div id="bar" style="background:#ff4b4b;border-radius:4px;height:10px;width:0%"></div></div>
+  <div id="stage" style="margin-top:6px">Waiting for updates...</div>
+  <div id="quality" style="margin-top:4px"></div>
+</div>
+<script>
+const ws = new WebSocket(__WS_URL__);
+ws.onmessage = (evt) => {
+  const d = JSON.parse(evt.data);
+  window.parent.postMessage({ type: 'SONORA_PROGRESS', data: d }, "*");
+  if (d.progress !== undefined) {
+    const pct = d.progress <= 1 ? d.progress * 100 : d.progress;
+    document.getElementById('bar').style.width = Math.min(pct, 100) + '%';
+  }
+  if (d.stage) document.getElementById('stage').textContent = d.stage;
+  if (d.quality_score !== undefined) document.getElementById('quality').textContent = 'Quality Score: ' + Number(d.quality_score).toFixed(2);
+  if (d.status === 'completed') { document.getElementById('stage').textContent = '🎉 Real-time processing completed!'; ws.close(); }
+};
+ws.onerror = () => { document.getElementById('stage').textContent = 'Live updates unavailable'; };
+</script>
+"""
+
+# Simple polling fallback: one short-timeout fetch, live updates arrive over the WS above
+@st.cache_data(ttl=5)
 def poll_status():
     try:
-        r = requests.get(API_BASE + "/health", timeout=2)
+        r = http.get(API_BASE + "/health", timeout=0.5)
         return r.json()
     except Exception:
         return {"status": "down", "uptime": 0}
 
-# Poll and update UI
-for i in range(3):
-    s = poll_status()
-    uptime_placeholder.metric("Uptime (s)", int(s.get("uptime",0)))
-    pipeline_placeholder.text(json.dumps(s, indent=2))
-    time.sleep(0.5)
+def request_status_refresh():
+    poll_status.clear()
+    st.session_state.need_status_refresh = True
+
+with actions_col:
+    st.button("🔄 Refresh Status", on_click=request_status_refresh)
+
+# Only hit /health on first load or an explicit refresh; widget tweaks reuse the last status
+if st.session_state.get("need_status_refresh", True):
+    st.session_state.last_status = poll_status()
+    st.session_state.need_status_refresh = False
+s = st.session_state.last_status
+uptime_placeholder.metric("Uptime (s)", int(s.get("uptime",0)))
+pipeline_placeholder.text(json_pretty(s))
 
 st.markdown("---")
 st.header("🎤 Text-to-Speech (TTS) Generation")
@@ -96,7 +191,7 @@ st.header("🎤 Text-to-Speech (TTS) Generation")
 # TTS Provider Selection
 tts_provider = st.selectbox(
     "Select TTS Provider",
-    ["VibeVoice", "ElevenLabs"],
+    TTS_PROVIDERS,
     index=0,
     help="Choose between Microsoft VibeVoice (local model) or ElevenLabs (cloud API)"
 )
@@ -113,14 +208,14 @@ col1, col2 = st.columns(2)
 with col1:
     tts_emotion = st.selectbox(
         "Emotion",
-        ["neutral", "happy", "sad", "angry", "excited", "calm"],
+        EMOTIONS,
         index=0,
         key="tts_emotion"
     )
     
     tts_tone = st.selectbox(
         "Tone",
-        ["normal", "high", "low", "whisper", "shout"],
+        TONES,
         index=0,
         key="tts_tone"
     )
@@ -159,7 +254,7 @@ if st.button("🎵 Generate Speech", type="primary"):
                 }
                 
                 # Make API call
-                response = requests.post(
+                response = http.post(
                     API_BASE + "/api/tts/generate",
                     json=request_data,
                     timeout=60
@@ -188,15 +283,9 @@ if st.button("🎵 Generate Speech", type="primary"):
                             audio_url = f"{API_BASE}/api/tts/audio/{audio_path}"
                             st.audio(audio_url, format="audio/wav")
                             
-                            # Download button
-                            audio_response = requests.get(audio_url)
-                            if audio_response.status_code == 200:
-                                st.download_button(
-                                    label="📥 Download Audio",
-                                    data=audio_response.content,
-                                    file_name=f"tts_{tts_provider.lower()}_{int(time.time())}.wav",
-                                    mime="audio/wav"
-                                )
+                            # Direct download link: the browser fetches the WAV itself instead of proxying it through Streamlit
+                            file_name = f"tts_{tts_provider.lower()}_{int(time.time())}.wav"
+                            st.markdown(f'<a href="{audio_url}" download="{file_name}">📥 Download Audio</a>', unsafe_allow_html=True)
                     else:
                         st.error(f"❌ TTS generation failed: {result.get('error', 'Unknown error')}")
                 else:
@@ -217,38 +306,38 @@ with st.expander("🎛️ Advanced Settings"):
     with col1:
         target_language = st.selectbox(
             "Target Language", 
-            ["en", "ja", "ko", "zh", "es", "fr", "de"],
+            TARGET_LANGUAGES,
             index=0
         )
         
         voice_id = st.selectbox(
             "Voice Character",
-            ["anime_female_01", "anime_male_01", "anime_female_mature"],
+            VOICE_CHARACTERS,
             index=0
         )
         
         emotion = st.selectbox(
             "Emotion",
-            ["neutral", "happy", "sad", "angry", "excited", "calm"],
+            EMOTIONS,
             index=0
         )
     
     with col2:
         tone = st.selectbox(
             "Tone",
-            ["normal", "high", "low", "whisper", "shout"],
+            TONES,
             index=0
         )
         
         lip_sync_model = st.selectbox(
             "Lip-Sync Model",
-            ["auto", "wav2lip", "sadtalker", "real_esrgan"],
+            LIP_SYNC_MODELS,
             index=0
         )
         
         quality_mode = st.selectbox(
             "Quality Mode",
-            ["fast", "balanced", "high_quality"],
+            QUALITY_MODES,
             index=1
         )
 
@@ -271,8 +360,9 @@ if uploaded and multichar_mode:
     if st.button("Preview Speaker Detection"):
         with st.spinner("Analyzing speakers..."):
             try:
-                files = {"file": (uploaded.name, uploaded.getvalue(), uploaded.type)}
-                r = requests.post(API_BASE + "/api/multichar/preview/diarization", files=files, timeout=60)
+                uploaded.seek(0)  # UploadedFile is file-like; requests streams it without another copy
+                files = {"file": (uploaded.name, uploaded, uploaded.type)}
+                r = http.post(API_BASE + "/api/multichar/preview/diarization", files=files, timeout=60)
                 
                 if r.status_code == 200:
                     data = r.json()
@@ -290,15 +380,15 @@ if uploaded and multichar_mode:
                     # Show speaker timeline
                     if segments:
                         st.subheader("Speaker Timeline")
-                        timeline_data = []
-                        for seg in segments[:10]:  # Show first 10 segments
-                            timeline_data.append({
-                                "Speaker": seg["speaker"],
-                                "Start": f"{seg['start']:.1f}s",
-                                "End": f"{seg['end']:.1f}s",
-                                "Duration": f"{seg['end'] - seg['start']:.1f}s"
-                            })
-                        st.dataframe(timeline_data)
+                        top = segments[:10]  # Show first 10 segments
+                        timeline_df = pd.DataFrame({
+                            "Speaker": [seg["speaker"] for seg in top],
+                            "Start": np.fromiter((seg["start"] for seg in top), dtype=np.float64, count=len(top)),
+                            "End": np.fromiter((seg["end"] for seg in top), dtype=np.float64, count=len(top)),
+                        })
+                        timeline_df["Duration"] = timeline_df["End"] - timeline_df["Start"]
+                        seconds = st.column_config.NumberColumn(format="%.1fs")
+                        st.dataframe(timeline_df, column_config={"Start": seconds, "End": seconds, "Duration": seconds})
                 else:
                     st.error(f"Preview failed: {r.text}")
             except Exception as e:
@@ -311,8 +401,9 @@ if uploaded:
         if st.button("Start Multi-Character Dub", type="primary"):
             with st.spinner("Processing multi-character dubbing..."):
                 try:
-                    files = {"file": (uploaded.name, uploaded.getvalue(), uploaded.type)}
-                    r = requests.post(API_BASE + "/api/multichar/dub/video", files=files, timeout=600)
+                    uploaded.seek(0)
+                    files = {"file": (uploaded.name, uploaded, uploaded.type)}
+                    r = http.post(API_BASE + "/api/multichar/dub/video", files=files, timeout=600)
                     
                     if r.status_code == 200:
                         result = r.json()
@@ -373,128 +464,99 @@ if uploaded:
         }
         
         # Prepare file data
-        files = {"file": (uploaded.name, uploaded.getvalue(), uploaded.type)}
+        uploaded.seek(0)
+        files = {"file": (uploaded.name, uploaded, uploaded.type)}
         
         if enable_realtime:
-        # Real-time processing
-        st.info("🚀 Starting real-time processing...")
-        
-        # Create placeholder for real-time updates
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        quality_metrics = st.empty()
+            # Real-time processing
+            st.info("🚀 Starting real-time processing...")
         
-        try:
-            # Start processing
-            response = requests.post(
-                API_BASE + "/api/dub/video", 
-                files=files, 
-                params=params,
-                timeout=1200
-            )
+            try:
+                # Start processing
+                response = http.post(
+                    API_BASE + "/api/dub/video", 
+                    files=files, 
+                    params=params,
+                    timeout=1200
+                )
             
-            result = response.json()
+                result = response.json()
             
-            if result.get("status") == "processing_realtime":
-                session_id = result["session_id"]
-                websocket_url = result["websocket_url"]
-                
-                st.success(f"✅ Processing started! Session ID: {session_id}")
-                st.info(f"WebSocket URL: {websocket_url}")
+                if result.get("status") == "processing_realtime":
+                    session_id = result["session_id"]
+                    websocket_url = result["websocket_url"]
                 
-                # Simulate real-time updates (in a real implementation, 
-                # this would connect to the WebSocket)
-                for i in range(10):
-                    progress = (i + 1) / 10
-                    progress_bar.progress(progress)
-                    
-                    stages = [
-                        "Initializing...",
-                        "Extracting audio...",
-                        "Transcribing...",
-                        "Translating...",
-                        "Synthesizing voice...",
-                        "Lip-syncing...",
-                        "Composing final video...",
-                        "Quality assessment...",
-                        "Finalizing...",
-                        "Completed!"
-                    ]
-                    
-                    status_text.text(f"Stage {i+1}/10: {stages[i]}")
-                    
-                    # Simulate quality metrics
-                    if i >= 7:
-                        quality_metrics.metric("Quality Score", f"{0.85 + (i-7)*0.05:.2f}")
-                    
-                    time.sleep(0.5)
+                    st.success(f"✅ Processing started! Session ID: {session_id}")
+                    st.info(f"WebSocket URL: {websocket_url}")
                 
-                st.success("🎉 Real-time processing completed!")
+                    # Live progress is pushed by the backend over the session WebSocket and
+                    # rendered in the browser; the script thread does not wait on the job
+                    html(PROGRESS_JS_TEMPLATE.replace("__WS_URL__", json.dumps(websocket_url)), height=90)
                 
-            else:
-                st.error(f"❌ Processing failed: {result.get('error', 'Unknown error')}")
+                else:
+                    st.error(f"❌ Processing failed: {result.get('error', 'Unknown error')}")
                 
-        except requests.exceptions.Timeout:
-            st.error("⏰ Processing timeout - try reducing quality or file size")
-        except Exception as e:
-            st.error(f"❌ Error: {str(e)}")
+            except requests.exceptions.Timeout:
+                st.error("⏰ Processing timeout - try reducing quality or file size")
+            except Exception as e:
+                st.error(f"❌ Error: {str(e)}")
     
-    else:
-        # Standard processing
-        st.info("🔄 Processing video with advanced AI features...")
+        else:
+            # Standard processing
+            st.info("🔄 Processing video with advanced AI features...")
         
-        with st.spinner("Processing in progress..."):
-            try:
-                response = requests.post(
-                    API_BASE + "/api/dub/video", 
-                    files=files, 
-                    params=params,
-                    timeout=1200
-                )
+            with st.spinner("Processing in progress..."):
+                try:
+                    response = http.post(
+                        API_BASE + "/api/dub/video", 
+                        files=files, 
+                        params=params,
+                        timeout=1200
+                    )
                 
-                result = response.json()
+                    result = response.json()
                 
-                if result.get("status") == "completed":
-                    st.success("✅ Processing completed!")
+                    if result.get("status") == "completed":
+                        st.success("✅ Processing completed!")
                     
-                    # Display results
-                    col1, col2, col3 = st.columns(3)
+                        # Display results
+                        col1, col2, col3 = st.columns(3)
                     
-                    with col1:
-                        st.metric("Quality Score", f"{result.get('quality_score', 0):.2f}")
+                        with col1:
+                            st.metric("Quality Score", f"{result.get('quality_score', 0):.2f}")
                     
-                    with col2:
-                        st.metric("Processing Time", f"{result.get('processing_time', 0):.1f}s")
+                        with col2:
+                            st.metric("Processing Time", f"{result.get('processing_time', 0):.1f}s")
                     
-                    with col3:
-                        st.metric("Model Used", result.get('model_used', 'unknown'))
+                        with col3:
+                            st.metric("Model Used", result.get('model_used', 'unknown'))
                     
-                    # Quality level indicator
-                    quality_level = result.get('quality_level', 'unknown')
-                    quality_colors = {
-                        'excellent': '🟢',
-                        'good': '🟡', 
-                        'fair': '🟠',
-                        'poor': '🔴'
-                    }
+                        # Quality level indicator
+                        quality_level = result.get('quality_level', 'unknown')
+                        quality_colors = {
+                            'excellent': '🟢',
+                            'good': '🟡', 
+                            'fair': '🟠',
+                            'poor': '🔴'
+                        }
                     
-                    st.info(f"Quality Level: {quality_colors.get(quality_level, '⚪')} {quality_level.title()}")
+                        st.info(f"Quality Level: {quality_colors.get(quality_level, '⚪')} {quality_level.title()}")
                     
-                    # Download link (mock)
-                    st.download_button(
-                        label="📥 Download Dubbed Video",
-                        data=b"Mock video data",  # In real implementation, this would be the actual video
-                        file_name=f"dubbed_{uploaded.name}",
-                        mime="video/mp4"
-                    )
+                        # Download link (mock)
+                        st.download_button(
+                            label="📥 Download Dubbed Video",
+                            data=b"Mock video data",  # In real implementation, this would be the actual video
+                            file_name=f"dubbed_{uploaded.name}",
+                            mime="video/mp4"
+                        )
                     
-                else:
-                    st.error(f"❌ Processing failed: {result.get('error', 'Unknown error')}")
+                    else:
+                        st.error(f"❌ Processing failed: {result.get('error', 'Unknown error')}")
                     
-            except requests.exceptions.Timeout:
-                st.error("⏰ Processing timeout - try reducing quality or file size")
-            except Exception as e:
-                st.error(f"❌ Error: {str(e)}")
+                except requests.exceptions.Timeout:
+                    st.error("⏰ Processing timeout - try reducing quality or file size")
+                except Exception as e:
+                    st.error(f"❌ Error: {str(e)}")
 
 # AI Features showcase
 st.markdown("---")
@@ -537,31 +599,24 @@ ai_status_col1, ai_status_col2 = st.columns(2)
 
 with ai_status_col1:
     st.subheader("TTS Models")
-    tts_status = {
-        "VibeVoice": "🟢 Active",
-        "ElevenLabs": "🟡 Fallback", 
-        "Mock TTS": "🟢 Available"
-    }
-    
-    for model, status in tts_status.items():
+    for model, status in TTS_STATUS:
         st.text(f"{model}: {status}")
 
 with ai_status_col2:
     st.subheader("Lip-Sync Models")
-    lipsync_status = {
-        "Wav2Lip": "🟢 Available",
-        "SadTalker": "🟡 GPU Required",
-        "Real-ESRGAN": "🔴 Not Installed",
-        "Mock Mode": "🟢 Always Available"
-    }
-    
-    for model, status in lipsync_status.items():
+    for model, status in LIPSYNC_STATUS:
         st.text(f"{model}: {status}")
 
 # Performance Dashboard
 st.markdown("---")
 st.header("📊 Performance Dashboard")
 
+# Auto-refresh toggle: only the performance tab fragments rerun on the interval
+st.sidebar.markdown("---")
+st.sidebar.header("Performance Dashboard")
+auto_refresh_perf = st.sidebar.checkbox("Auto-refresh Performance Data", value=False)
+PERF_REFRESH = 5 if auto_refresh_perf else None
+
 # Create tabs for different performance views
 tab1, tab2, tab3, tab4 = st.tabs(["Latency & Throughput", "Resource Usage", "Quality Metrics", "Error Logs"])
 
@@ -569,40 +624,104 @@ tab1, tab2, tab3, tab4 = st.tabs(["Latency & Throughput", "Resource Usage", "Qua
 REPORTS_DIR = Path("reports")
 LOGS_DIR = Path("logs")
 
-with tab1:
+# Report loaders are keyed on the file's mtime, so reruns reuse the parsed copy until it changes
+# One directory scan per rerun instead of an exists()/stat() per report file
+@st.cache_data(ttl=2)
+def _report_index(directory: str):
+    try:
+        with os.scandir(directory) as entries:
+            return {e.name: e.stat().st_mtime for e in entries if e.is_file()}
+    except FileNotFoundError:
+        return {}
+
+@st.cache_data(ttl=5)
+def _load_metrics(path: str, mtime: float):
+    return json_loads(Path(path).read_bytes())
+
+@st.cache_data(ttl=5)
+def _load_text(path: str, mtime: float):
+    return Path(path).read_text()
+
+@st.cache_data
+def _read_html(path: str, mtime: float):
+    # Chart embeds can be several MB; decode straight from the mapped pages
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return m[:].decode('utf-8')
+
+@st.cache_data(ttl=5)
+def _tail_log(path: str, mtime: float, n: int = 50):
+    # Read backwards from EOF in 16 KB steps until n lines are buffered
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buf = b''
+        while pos > 0 and buf.count(b'\n') <= n:
+            step = min(16384, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+    return b'\n'.join(buf.splitlines()[-n:]).decode('utf-8', 'replace')
+
+@st.cache_data(ttl=5)
+def _latency_view(path: str, mtime: float):
+    # Built once per metrics mtime; reruns get the cached figure and table back
+    endpoint_stats = _load_metrics(path, mtime)["summary"]["endpoint_stats"]
+    n = len(endpoint_stats)
+    names = np.array(list(endpoint_stats))
+    latencies = np.fromiter((v["avg_latency"] for v in endpoint_stats.values()), dtype=np.float64, count=n)
+    counts = np.fromiter((v["count"] for v in endpoint_stats.values()), dtype=np.int64, count=n)
+    
+    go = _plotly_go()
+    fig = go.Figure(go.Bar(x=names, y=latencies, marker_color='lightblue'))
+    fig.update_layout(
+        title="Average Latency by Endpoint",
+        xaxis_title="Endpoint",
+        yaxis_title="Latency (seconds)",
+        template="plotly_white"
+    )
+    df = pd.DataFrame({"Endpoint": names, "Avg Latency (s)": latencies, "Count": counts})
+    return fig, df
+
+# Shared by all sessions: report reads overlap here while rendering stays on the script thread
+@st.cache_resource
+def _io_pool():
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="sonora-ui-io")
+
+def _submit_io(fn, *args):
+    # Hand the caller's run context to the worker so st.cache_data lookups there behave as on the script thread
+    ctx = get_script_run_ctx()
+    def run():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args)
+    return _io_pool().submit(run)
+
+@st.cache_data(ttl=5)
+def _load_image(path: str, mtime: float):
+    img = _pil_image().open(path)
+    img.load()
+    return img
+
+@st.fragment(run_every=PERF_REFRESH)
+def _render_tab1():
+    reports = _report_index(str(REPORTS_DIR))
     st.subheader("Latency & Throughput")
     
     # Load latest metrics
     metrics_file = REPORTS_DIR / "system_metrics.json"
-    if metrics_file.exists():
+    if metrics_file.name in reports:
         try:
-            with open(metrics_file, 'r') as f:
-                metrics_data = json.load(f)
+            metrics_data = _load_metrics(str(metrics_file), reports[metrics_file.name])
             
             if "summary" in metrics_data and "endpoint_stats" in metrics_data["summary"]:
                 endpoint_stats = metrics_data["summary"]["endpoint_stats"]
                 
-                if endpoint_stats and PLOTLY_AVAILABLE:
-                    # Create latency bar chart
-                    endpoints = list(endpoint_stats.keys())
-                    avg_latencies = [stats["avg_latency"] for stats in endpoint_stats.values()]
-                    
-                    fig = go.Figure(data=[
-                        go.Bar(x=endpoints, y=avg_latencies, marker_color='lightblue')
-                    ])
-                    fig.update_layout(
-                        title="Average Latency by Endpoint",
-                        xaxis_title="Endpoint",
-                        yaxis_title="Latency (seconds)",
-                        template="plotly_white"
-                    )
+                if endpoint_stats and _plotly_go() is not None:
+                    # Latency bar chart and table
+                    fig, df = _latency_view(str(metrics_file), reports[metrics_file.name])
                     st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Display table
-                    df = pd.DataFrame([
-                        {"Endpoint": name, "Avg Latency (s)": stats["avg_latency"], "Count": stats["count"]}
-                        for name, stats in endpoint_stats.items()
-                    ])
                     st.dataframe(df, use_container_width=True)
                 else:
                     st.info("No endpoint statistics available")
@@ -615,19 +734,23 @@ with tab1:
     
     # Latency histogram image
     latency_img = REPORTS_DIR / "latency_histogram.png"
-    if latency_img.exists() and PIL_AVAILABLE:
+    if latency_img.name in reports and _pil_image() is not None:
         st.subheader("Latency Distribution")
-        img = Image.open(latency_img)
+        img = _load_image(str(latency_img), reports[latency_img.name])
         st.image(img, use_container_width=True)
 
-with tab2:
+with tab1:
+    _render_tab1()
+
+@st.fragment(run_every=PERF_REFRESH)
+def _render_tab2():
+    reports = _report_index(str(REPORTS_DIR))
     st.subheader("Resource Usage")
     
     metrics_file = REPORTS_DIR / "system_metrics.json"
-    if metrics_file.exists():
+    if metrics_file.name in reports:
         try:
-            with open(metrics_file, 'r') as f:
-                metrics_data = json.load(f)
+            metrics_data = _load_metrics(str(metrics_file), reports[metrics_file.name])
             
             summary = metrics_data.get("summary", {})
             
@@ -643,19 +766,20 @@ with tab2:
             with col4:
                 st.metric("Peak Memory", f"{summary.get('max_memory_percent', 0):.1f}%")
             
-            # GPU usage chart
+            # Read both chart embeds concurrently
             gpu_html = REPORTS_DIR / "gpu_usage.html"
-            if gpu_html.exists():
-                with open(gpu_html, 'r') as f:
-                    st.components.v1.html(f.read(), height=400)
+            memory_html = REPORTS_DIR / "memory_timeline.html"
+            pending = {p: _submit_io(_read_html, str(p), reports[p.name]) for p in (gpu_html, memory_html) if p.name in reports}
+            
+            # GPU usage chart
+            if gpu_html in pending:
+                st.components.v1.html(pending[gpu_html].result(), height=400)
             else:
                 st.info("GPU usage chart not available. Run benchmark to generate.")
             
             # Memory timeline
-            memory_html = REPORTS_DIR / "memory_timeline.html"
-            if memory_html.exists():
-                with open(memory_html, 'r') as f:
-                    st.components.v1.html(f.read(), height=400)
+            if memory_html in pending:
+                st.components.v1.html(pending[memory_html].result(), height=400)
             else:
                 st.info("Memory timeline not available. Run benchmark to generate.")
                 
@@ -664,39 +788,37 @@ with tab2:
     else:
         st.info("No metrics file found. Run benchmark to generate resource usage data.")
 
-with tab3:
+with tab2:
+    _render_tab2()
+
+@st.fragment(run_every=PERF_REFRESH)
+def _render_tab3():
+    reports = _report_index(str(REPORTS_DIR))
     st.subheader("Quality Metrics")
     
     metrics_file = REPORTS_DIR / "system_metrics.json"
-    if metrics_file.exists():
+    if metrics_file.name in reports:
         try:
-            with open(metrics_file, 'r') as f:
-                metrics_data = json.load(f)
+            metrics_data = _load_metrics(str(metrics_file), reports[metrics_file.name])
             
             # Quality correlation chart
             quality_html = REPORTS_DIR / "quality_correlation.html"
-            if quality_html.exists():
-                with open(quality_html, 'r') as f:
-                    st.components.v1.html(f.read(), height=400)
+            if quality_html.name in reports:
+                st.components.v1.html(_read_html(str(quality_html), reports[quality_html.name]), height=400)
             else:
                 st.info("Quality correlation chart not available.")
             
             # Display quality scores
             if "results" in metrics_data:
-                results = metrics_data["results"]
-                quality_data = []
-                
-                for result in results:
-                    if result.get("success"):
-                        quality_data.append({
-                            "Endpoint": result.get("name", "Unknown"),
-                            "Latency (s)": result.get("latency", 0),
-                            "Processing Time (s)": result.get("processing_time", 0),
-                            "Status": "✅ Success"
-                        })
+                ok = [result for result in metrics_data["results"] if result.get("success")]
                 
-                if quality_data:
-                    df = pd.DataFrame(quality_data)
+                if ok:
+                    df = pd.DataFrame({
+                        "Endpoint": [result.get("name", "Unknown") for result in ok],
+                        "Latency (s)": np.fromiter((result.get("latency", 0) for result in ok), dtype=np.float64, count=len(ok)),
+                        "Processing Time (s)": np.fromiter((result.get("processing_time", 0) for result in ok), dtype=np.float64, count=len(ok)),
+                        "Status": "✅ Success"
+                    })
                     st.dataframe(df, use_container_width=True)
                     
         except Exception as e:
@@ -706,31 +828,32 @@ with tab3:
     
     # Performance summary
     summary_file = REPORTS_DIR / "performance_summary.md"
-    if summary_file.exists():
+    if summary_file.name in reports:
         with st.expander("📄 View Performance Summary Report"):
-            with open(summary_file, 'r') as f:
-                st.markdown(f.read())
+            st.markdown(_load_text(str(summary_file), reports[summary_file.name]))
 
-with tab4:
+with tab3:
+    _render_tab3()
+
+@st.fragment(run_every=PERF_REFRESH)
+def _render_tab4():
+    reports = _report_index(str(REPORTS_DIR))
+    logs = _report_index(str(LOGS_DIR))
     st.subheader("Error Logs")
     
     log_file = LOGS_DIR / "test_results.log"
-    if log_file.exists():
+    if log_file.name in logs:
         try:
-            with open(log_file, 'r') as f:
-                log_lines = f.readlines()
-            
             # Show last 50 lines
-            st.text_area("Recent Log Entries", "\n".join(log_lines[-50:]), height=400)
+            st.text_area("Recent Log Entries", _tail_log(str(log_file), logs[log_file.name]), height=400)
             
-            # Download log button
-            with open(log_file, 'r') as f:
-                st.download_button(
-                    label="📥 Download Full Log",
-                    data=f.read(),
-                    file_name="test_results.log",
-                    mime="text/plain"
-                )
+            # Download log button (file is only read when clicked)
+            st.download_button(
+                label="📥 Download Full Log",
+                data=log_file.read_bytes,
+                file_name="test_results.log",
+                mime="text/plain"
+            )
         except Exception as e:
             st.error(f"Error reading log file: {e}")
     else:
@@ -738,10 +861,9 @@ with tab4:
     
     # Error statistics
     metrics_file = REPORTS_DIR / "system_metrics.json"
-    if metrics_file.exists():
+    if metrics_file.name in reports:
         try:
-            with open(metrics_file, 'r') as f:
-                metrics_data = json.load(f)
+            metrics_data = _load_metrics(str(metrics_file), reports[metrics_file.name])
             
             summary = metrics_data.get("summary", {})
             total_tests = summary.get("total_tests", 0)
@@ -757,18 +879,12 @@ with tab4:
         except Exception as e:
             st.error(f"Error loading error statistics: {e}")
 
-# Auto-refresh toggle
-st.sidebar.markdown("---")
-st.sidebar.header("Performance Dashboard")
-auto_refresh_perf = st.sidebar.checkbox("Auto-refresh Performance Data", value=False)
-
-if auto_refresh_perf:
-    time.sleep(5)
-    st.rerun()
+with tab4:
+    _render_tab4()
 
 # Manual refresh button
 if st.sidebar.button("🔄 Refresh Performance Data"):
-    st.cache_data.clear()
+    _report_index.clear()
     st.rerun()
 
 # Run benchmark button
@@ -780,10 +896,15 @@ if st.sidebar.button("🚀 Run Performance Benchmark"):
         # Run benchmark in background
         benchmark_path = Path("sonora/scripts/benchmark_system_performance.py")
         if benchmark_path.exists():
-            subprocess.Popen([
-                sys.executable,
-                str(benchmark_path)
-            ])
+            # Fully detached: the child can't block on an inherited stdout pipe or die with this session
+            subprocess.Popen(
+                [sys.executable, str(benchmark_path)],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+                close_fds=True
+            )
             st.sidebar.success("Benchmark started! Check back in a few minutes.")
         else:
             st.sidebar.error("Benchmark script not found")
@@ -1,11 +1,19 @@
 import streamlit as st
 import requests
 import json
+from requests.adapters import HTTPAdapter
 
 st.set_page_config(page_title="Sonora AI Interface (Mock)", layout="wide")
 
 API_URL = "http://127.0.0.1:8000"
 
+@st.cache_resource
+def get_session():
+    # One keep-alive session per Streamlit process, shared by every tab
+    s = requests.Session()
+    s.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=1))
+    return s
+
 st.title("🎧 Sonora Voice & Sound Playground")
 st.caption("Local mock version — connected to FastAPI backend")
 
@@ -24,8 +32,9 @@ with tabs[0]:
     audio_file = st.file_uploader("Upload audio for transcription", type=["wav", "mp3", "m4a"])
     if st.button("Run ASR"):
         if audio_file:
-            files = {"file": audio_file.getvalue()}
-            res = requests.post(f"{API_URL}/asr", files=files)
+            audio_file.seek(0)
+            files = {"file": (audio_file.name, audio_file, audio_file.type)}
+            res = get_session().post(f"{API_URL}/asr", files=files)
             st.json(res.json())
         else:
             st.warning("Please upload an audio file first.")
@@ -36,7 +45,7 @@ with tabs[1]:
     text = st.text_area("Enter text to generate speech")
     if st.button("Run TTS"):
         if text.strip():
-            res = requests.post(f"{API_URL}/tts", json={"text": text})
+            res = get_session().post(f"{API_URL}/tts", json={"text": text})
             data = res.json()
             st.audio(data.get("audio_url", ""), format="audio/wav")
             st.json(data)
@@ -49,7 +58,7 @@ with tabs[2]:
     text = st.text_area("Enter text to translate")
     target_lang = st.selectbox("Target language", ["en", "ja", "ko", "hi", "fr", "es"])
     if st.button("Run Translation"):
-        res = requests.post(f"{API_URL}/translate", json={"text": text, "lang": target_lang})
+        res = get_session().post(f"{API_URL}/translate", json={"text": text, "lang": target_lang})
         st.json(res.json())
 
 # ---- Voice Clone ----
@@ -59,8 +68,9 @@ with tabs[3]:
     clone_text = st.text_area("Enter text to synthesize in cloned voice")
     if st.button("Clone Voice"):
         if voice_sample and clone_text:
-            files = {"file": voice_sample.getvalue()}
-            res = requests.post(f"{API_URL}/clone", files=files, data={"text": clone_text})
+            voice_sample.seek(0)
+            files = {"file": (voice_sample.name, voice_sample, voice_sample.type)}
+            res = get_session().post(f"{API_URL}/clone", files=files, data={"text": clone_text})
             st.audio(res.content, format="audio/wav")
         else:
             st.warning("Upload sample and enter text first.")
@@ -72,8 +82,9 @@ with tabs[4]:
     audio_file = st.file_uploader("Upload reference audio", type=["wav", "mp3"])
     if st.button("Run Sync"):
         if transcript and audio_file:
-            files = {"file": audio_file.getvalue()}
-            res = requests.post(f"{API_URL}/align", files=files, data={"text": transcript})
+            audio_file.seek(0)
+            files = {"file": (audio_file.name, audio_file, audio_file.type)}
+            res = get_session().post(f"{API_URL}/align", files=files, data={"text": transcript})
             st.json(res.json())
         else:
             st.warning("Need both transcript and audio.")
@@ -81,7 +92,7 @@ with tabs[4]:
 # ---- Model Inspector ----
 with tabs[5]:
     st.subheader("Inspect Available Models")
-    res = requests.get(f"{API_URL}/models")
+    res = get_session().get(f"{API_URL}/models")
     if res.ok:
         data = res.json()
         st.success(f"Connected to backend: {API_URL}")
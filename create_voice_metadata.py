@@ -6,21 +6,36 @@ Creates unified metadata for expressive voice datasets (CREMA-D, JVS, RAVDESS, L
 for fine-tuning VibeVoice or AutoTrain pipelines.
 
 Usage:
-    python create_voice_metadata.py [--data-dir /path/to/data] [--output-dir /path/to/output]
+    python create_voice_metadata.py [--data-dir /path/to/data] [--output-dir /path/to/output] [--format parquet|feather|csv]
 """
 
 import os
 import json
 import argparse
+import hashlib
+import functools
+import subprocess
+import threading
 import pandas as pd
-import librosa
+import soundfile as sf
 from tqdm import tqdm
 from pathlib import Path
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 import warnings
 
 warnings.filterwarnings('ignore', category=UserWarning)
 
+# Prefer orjson for the summary dump; UTF-8 bytes either way (non-ASCII kept as-is)
+try:
+    import orjson
+    def json_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def json_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
 
 # ===========================================
 # CONFIGURATION
@@ -54,6 +69,78 @@ EMOTION_MAP = {
 }
 
 STANDARD_EMOTIONS = ["neutral", "happy", "sad", "angry", "fearful", "disgust", "surprise", "calm", "other"]
+STANDARD_EMOTION_SET = frozenset(STANDARD_EMOTIONS)
+
+
+def _build_emotion_keywords() -> Tuple[Tuple[str, str], ...]:
+    """Lower-cased EMOTION_MAP keys in map order, first spelling wins (e.g. DISGUST/disgust)."""
+    keywords: Dict[str, str] = {}
+    for key, value in EMOTION_MAP.items():
+        keywords.setdefault(key.lower(), value)
+    return tuple(keywords.items())
+
+# Built once for filename matching instead of lower-casing every key for every file
+EMOTION_KEYWORDS = _build_emotion_keywords()
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_emotion_label(emotion: str) -> str:
+    """Normalize emotion to standard set (memoized: datasets repeat a handful of labels)."""
+    if not emotion:
+        return "other"
+    emotion_upper = emotion.upper().strip()
+    normalized = EMOTION_MAP.get(emotion_upper, emotion.lower().strip())
+    # Ensure it's in standard set
+    if normalized not in STANDARD_EMOTION_SET:
+        # Try fuzzy match
+        for std_emotion in STANDARD_EMOTIONS:
+            if std_emotion in normalized or normalized in std_emotion:
+                return std_emotion
+        return "other"
+    return normalized
+
+# Unified metadata schema, in output column order
+METADATA_COLUMNS = ("audio_path", "transcript", "speaker_id", "emotion_label",
+                    "language", "dataset_source", "duration", "sample_rate", "notes")
+# Low-cardinality labels, stored as pandas categoricals (dictionary-encoded in Parquet)
+CATEGORICAL_COLUMNS = ("emotion_label", "language", "dataset_source")
+
+# Header probes are I/O-bound (libsndfile releases the GIL), so threads overlap them well
+PROBE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Dataset extractors scanned at once; each finished dataset's rows wait in memory until written
+EXTRACT_WORKERS = 2
+
+# Compressed formats: ffprobe parses the container instead of libsndfile/audioread decoding it
+FFPROBE_EXTS = (".mp3", ".m4a", ".aac")
+
+# Probe results persist between runs, keyed by (path, mtime_ns, size); needs pyarrow
+PROBE_CACHE_NAME = ".sonora_probe_cache.parquet"
+_PROBE_CACHE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_pool() -> ThreadPoolExecutor:
+    """One header-probe pool shared by all extractors, so concurrent datasets don't multiply threads."""
+    return ThreadPoolExecutor(max_workers=PROBE_WORKERS, thread_name_prefix="probe")
+
+
+def find_files(root: Path, exts: Tuple[str, ...]) -> List[Path]:
+    """Recursively collect files under root ending in one of exts, in a single os.scandir walk."""
+    found = []
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    # DirEntry caches the type from the directory read, so no extra stat per entry;
+                    # symlinked dirs are not followed, so a link cycle cannot loop the walk
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(exts):
+                        found.append(Path(entry.path))
+        except OSError:
+            continue
+    return found
 
 
 # ===========================================
@@ -63,37 +150,154 @@ STANDARD_EMOTIONS = ["neutral", "happy", "sad", "angry", "fearful", "disgust", "
 class MetadataExtractor:
     """Base class for dataset-specific metadata extraction."""
     
+    # Folder names extract() may read under base_dir, besides dataset_name
+    DIR_NAMES: Tuple[str, ...] = ()
+    
     def __init__(self, base_dir: str, dataset_name: str):
         self.base_dir = Path(base_dir)
         self.dataset_name = dataset_name
-        self.metadata_rows: List[Dict] = []
+        # Column-wise (one list per field) rather than a dict per row
+        self.columns: Dict[str, List] = {col: [] for col in METADATA_COLUMNS}
+        self._probe_cache_path = self.base_dir / PROBE_CACHE_NAME
+        self._probe_cache = self._load_probe_cache()
+        self._probe_cache_dirty = False
+    
+    def _load_probe_cache(self) -> Dict[Tuple[str, int, int], Tuple[float, int]]:
+        """Load persisted probe results, or an empty cache if missing/unreadable."""
+        if not self._probe_cache_path.exists():
+            return {}
+        try:
+            df = pd.read_parquet(self._probe_cache_path)
+        except Exception as e:
+            print(f"⚠️ Ignoring probe cache {self._probe_cache_path}: {e}")
+            return {}
+        return {
+            (p, int(m), int(z)): (float(d), int(r))
+            for p, m, z, d, r in zip(df["path"], df["mtime_ns"], df["size"], df["duration"], df["sample_rate"])
+        }
+    
+    def save_probe_cache(self):
+        """Merge this extractor's probe results into the on-disk cache."""
+        if not self._probe_cache_dirty:
+            return
+        # Other extractors share the file (possibly from other threads); fold in whatever they
+        # wrote since we loaded, holding the lock so concurrent merges can't drop each other's entries
+        with _PROBE_CACHE_LOCK:
+            merged = self._load_probe_cache()
+            merged.update(self._probe_cache)
+            df = pd.DataFrame(
+                [(p, m, z, d, r) for (p, m, z), (d, r) in merged.items()],
+                columns=["path", "mtime_ns", "size", "duration", "sample_rate"],
+            )
+            try:
+                df.to_parquet(self._probe_cache_path, compression="zstd", index=False)
+                self._probe_cache_dirty = False
+            except Exception as e:
+                print(f"⚠️ Could not write probe cache {self._probe_cache_path}: {e}")
+    
+    def dataset_dirs(self) -> List[Path]:
+        """Candidate dataset folders, for the metadata cache fingerprint."""
+        names = dict.fromkeys((self.dataset_name,) + self.DIR_NAMES)
+        return [self.base_dir / name for name in names]
     
     def normalize_emotion(self, emotion: str) -> str:
         """Normalize emotion to standard set."""
-        if not emotion:
-            return "other"
-        emotion_upper = emotion.upper().strip()
-        normalized = EMOTION_MAP.get(emotion_upper, emotion.lower().strip())
-        # Ensure it's in standard set
-        if normalized not in STANDARD_EMOTIONS:
-            # Try fuzzy match
-            for std_emotion in STANDARD_EMOTIONS:
-                if std_emotion in normalized or normalized in std_emotion:
-                    return std_emotion
-            return "other"
-        return normalized
+        return normalize_emotion_label(emotion)
     
     def get_audio_properties(self, audio_path: str) -> Tuple[Optional[float], Optional[int]]:
-        """Get duration and sample rate from audio file."""
+        """Get duration and sample rate from audio file, reusing cached probes of unchanged files."""
         try:
-            y, sr = librosa.load(audio_path, sr=None, mono=True, duration=300)  # Limit to 5min for speed
-            duration = round(librosa.get_duration(y=y, sr=sr), 2)
-            return duration, sr
-        except Exception as e:
+            st = os.stat(audio_path)
+        except OSError as e:
             print(f"⚠️ Error loading {audio_path}: {e}")
             return None, None
+        key = (os.path.abspath(audio_path), st.st_mtime_ns, st.st_size)
+        cached = self._probe_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        duration, sample_rate = self._read_audio_header(audio_path)
+        if duration is not None:
+            self._probe_cache[key] = (duration, sample_rate)
+            self._probe_cache_dirty = True
+        return duration, sample_rate
     
-    def extract(self) -> List[Dict]:
+    def _read_audio_header(self, audio_path: str) -> Tuple[Optional[float], Optional[int]]:
+        """Read duration and sample rate from the file header (no decode)."""
+        compressed = audio_path.lower().endswith(FFPROBE_EXTS)
+        if compressed:
+            try:
+                return self._ffprobe_header(audio_path)
+            except Exception:
+                pass  # ffprobe missing or unreadable stream: try libsndfile
+        try:
+            with sf.SoundFile(audio_path) as f:
+                return round(f.frames / f.samplerate, 2), f.samplerate
+        except Exception as e:
+            error = e
+        if not compressed:
+            # Formats libsndfile can't open: ffprobe parses most containers without decoding
+            try:
+                return self._ffprobe_header(audio_path)
+            except Exception:
+                pass
+        print(f"⚠️ Error loading {audio_path}: {error}")
+        return None, None
+    
+    def path_resolver(self, root: Path):
+        """Return a function mapping files found under root to resolved absolute paths.
+        
+        Symlinks in root are resolved once, instead of a resolve() (readlink walk) per file.
+        """
+        root_str = str(root)
+        real_root = os.path.realpath(root_str)
+        
+        def to_abs(audio_file: Path) -> str:
+            file_str = str(audio_file)
+            if file_str.startswith(root_str):
+                return real_root + file_str[len(root_str):]
+            return str(audio_file.resolve())
+        
+        return to_abs
+    
+    def _ffprobe_header(self, audio_path: str) -> Tuple[float, int]:
+        """Duration and sample rate of the first audio stream via ffprobe."""
+        result = subprocess.run([
+            'ffprobe', '-v', 'error', '-select_streams', 'a:0',
+            '-show_entries', 'stream=sample_rate:format=duration', '-of', 'json', audio_path
+        ], capture_output=True, text=True, check=True)
+        data = json.loads(result.stdout)
+        return round(float(data["format"]["duration"]), 2), int(data["streams"][0]["sample_rate"])
+    
+    def probe_audio(self, audio_files: List[Path]) -> List[Tuple[Optional[float], Optional[int]]]:
+        """Probe (duration, sample_rate) for many files concurrently, in input order."""
+        results = list(tqdm(_probe_pool().map(self.get_audio_properties, map(str, audio_files)),
+                            total=len(audio_files), desc=f"   Processing {self.dataset_name}"))
+        self.save_probe_cache()
+        return results
+    
+    def add_row(self, audio_path, transcript, speaker_id, emotion_label, language,
+                dataset_source, duration, sample_rate, notes):
+        """Append one file's metadata to the column lists."""
+        cols = self.columns
+        cols["audio_path"].append(audio_path)
+        cols["transcript"].append(transcript)
+        cols["speaker_id"].append(speaker_id)
+        cols["emotion_label"].append(emotion_label)
+        cols["language"].append(language)
+        cols["dataset_source"].append(dataset_source)
+        cols["duration"].append(duration)
+        cols["sample_rate"].append(sample_rate)
+        cols["notes"].append(notes)
+    
+    def as_dataframe(self) -> pd.DataFrame:
+        """Extracted metadata as a DataFrame with METADATA_COLUMNS."""
+        df = pd.DataFrame(self.columns, columns=list(METADATA_COLUMNS))
+        for col in CATEGORICAL_COLUMNS:
+            df[col] = df[col].astype("category")
+        return df
+    
+    def extract(self) -> pd.DataFrame:
         """Main extraction method - override in subclasses."""
         raise NotImplementedError
 
@@ -105,7 +309,9 @@ class CREMADExtractor(MetadataExtractor):
     Example: 1016_IEO_HAP_HI.wav
     """
     
-    def extract(self) -> List[Dict]:
+    DIR_NAMES = ("crema_d", "CREMA-D", "crema")
+    
+    def extract(self) -> pd.DataFrame:
         # Try multiple possible folder names
         path = self.base_dir / "crema_d"
         if not path.exists():
@@ -114,13 +320,14 @@ class CREMADExtractor(MetadataExtractor):
             path = self.base_dir / "crema"
         if not path.exists():
             print(f"⚠️ Skipping CREMA-D, directory not found: {path}")
-            return []
+            return self.as_dataframe()
         
         print(f"🔍 Scanning CREMA-D...")
-        audio_files = list(path.rglob("*.wav"))
+        audio_files = find_files(path, (".wav",))
+        to_abs = self.path_resolver(path)
         print(f"   Found {len(audio_files)} audio files")
         
-        for audio_file in tqdm(audio_files, desc="   Processing"):
+        for audio_file, (duration, sample_rate) in zip(audio_files, self.probe_audio(audio_files)):
             filename = audio_file.stem  # Without extension
             parts = filename.split("_")
             
@@ -133,21 +340,19 @@ class CREMADExtractor(MetadataExtractor):
                 speaker_id = "unknown"
                 emotion = "other"
             
-            duration, sample_rate = self.get_audio_properties(str(audio_file))
-            
-            self.metadata_rows.append({
-                "audio_path": str(audio_file.resolve()),
-                "transcript": None,
-                "speaker_id": speaker_id,
-                "emotion_label": emotion,
-                "language": "en",
-                "dataset_source": "crema_d",
-                "duration": duration,
-                "sample_rate": sample_rate,
-                "notes": None
-            })
+            self.add_row(
+                audio_path=to_abs(audio_file),
+                transcript=None,
+                speaker_id=speaker_id,
+                emotion_label=emotion,
+                language="en",
+                dataset_source="crema_d",
+                duration=duration,
+                sample_rate=sample_rate,
+                notes=None
+            )
         
-        return self.metadata_rows
+        return self.as_dataframe()
 
 
 class JVSExtractor(MetadataExtractor):
@@ -157,7 +362,9 @@ class JVSExtractor(MetadataExtractor):
     Supports: jvs, jvs_ver1
     """
     
-    def extract(self) -> List[Dict]:
+    DIR_NAMES = ("jvs", "jvs_ver1")
+    
+    def extract(self) -> pd.DataFrame:
         # Try multiple possible folder names
         path = self.base_dir / self.dataset_name
         if not path.exists():
@@ -166,13 +373,14 @@ class JVSExtractor(MetadataExtractor):
             path = self.base_dir / "jvs_ver1"
         if not path.exists():
             print(f"⚠️ Skipping JVS, directory not found: {path}")
-            return []
+            return self.as_dataframe()
         
         print(f"🔍 Scanning JVS...")
-        audio_files = list(path.rglob("*.wav"))
+        audio_files = find_files(path, (".wav",))
+        to_abs = self.path_resolver(path)
         print(f"   Found {len(audio_files)} audio files")
         
-        for audio_file in tqdm(audio_files, desc="   Processing"):
+        for audio_file, (duration, sample_rate) in zip(audio_files, self.probe_audio(audio_files)):
             # Extract speaker from path: jvs/{speaker}/...
             parts = audio_file.parts
             speaker_idx = -1
@@ -187,21 +395,19 @@ class JVSExtractor(MetadataExtractor):
             style = audio_file.parent.name
             emotion = self.normalize_emotion(style)
             
-            duration, sample_rate = self.get_audio_properties(str(audio_file))
-            
-            self.metadata_rows.append({
-                "audio_path": str(audio_file.resolve()),
-                "transcript": None,
-                "speaker_id": speaker_id,
-                "emotion_label": emotion,
-                "language": "ja",
-                "dataset_source": "jvs",
-                "duration": duration,
-                "sample_rate": sample_rate,
-                "notes": style
-            })
+            self.add_row(
+                audio_path=to_abs(audio_file),
+                transcript=None,
+                speaker_id=speaker_id,
+                emotion_label=emotion,
+                language="ja",
+                dataset_source="jvs",
+                duration=duration,
+                sample_rate=sample_rate,
+                notes=style
+            )
         
-        return self.metadata_rows
+        return self.as_dataframe()
 
 
 class RAVDESSExtractor(MetadataExtractor):
@@ -213,20 +419,23 @@ class RAVDESSExtractor(MetadataExtractor):
     Supports: ravdess, Audio_Speech_Actors_01-24
     """
     
-    def extract(self) -> List[Dict]:
+    DIR_NAMES = ("ravdess", "Audio_Speech_Actors_01-24")
+    
+    def extract(self) -> pd.DataFrame:
         # Try multiple possible folder names
         path = self.base_dir / "ravdess"
         if not path.exists():
             path = self.base_dir / "Audio_Speech_Actors_01-24"
         if not path.exists():
             print(f"⚠️ Skipping RAVDESS, directory not found: {path}")
-            return []
+            return self.as_dataframe()
         
         print(f"🔍 Scanning RAVDESS...")
-        audio_files = list(path.rglob("*.wav"))
+        audio_files = find_files(path, (".wav",))
+        to_abs = self.path_resolver(path)
         print(f"   Found {len(audio_files)} audio files")
         
-        for audio_file in tqdm(audio_files, desc="   Processing"):
+        for audio_file, (duration, sample_rate) in zip(audio_files, self.probe_audio(audio_files)):
             filename = audio_file.stem
             parts = filename.split("-")
             
@@ -239,21 +448,19 @@ class RAVDESSExtractor(MetadataExtractor):
                 speaker_id = "unknown"
                 emotion = "other"
             
-            duration, sample_rate = self.get_audio_properties(str(audio_file))
-            
-            self.metadata_rows.append({
-                "audio_path": str(audio_file.resolve()),
-                "transcript": None,
-                "speaker_id": f"ravdess_{speaker_id}",
-                "emotion_label": emotion,
-                "language": "en",
-                "dataset_source": "ravdess",
-                "duration": duration,
-                "sample_rate": sample_rate,
-                "notes": f"emotion_code={emotion_code}" if emotion_code else None
-            })
+            self.add_row(
+                audio_path=to_abs(audio_file),
+                transcript=None,
+                speaker_id=f"ravdess_{speaker_id}",
+                emotion_label=emotion,
+                language="en",
+                dataset_source="ravdess",
+                duration=duration,
+                sample_rate=sample_rate,
+                notes=f"emotion_code={emotion_code}" if emotion_code else None
+            )
         
-        return self.metadata_rows
+        return self.as_dataframe()
 
 
 class LibriSpeechExtractor(MetadataExtractor):
@@ -263,6 +470,32 @@ class LibriSpeechExtractor(MetadataExtractor):
     Transcripts are in corresponding .txt files.
     """
     
+    DIR_NAMES = ("librispeech", "libri", "train-clean-100")
+    
+    def __init__(self, base_dir: str, dataset_name: str):
+        super().__init__(base_dir, dataset_name)
+        # Parsed transcript files ({audio_id: text}), so each chapter's file is read once
+        self._transcript_index: Dict[Path, Dict[str, str]] = {}
+    
+    def dataset_dirs(self) -> List[Path]:
+        # extract() falls back to any train-clean-* folder
+        return super().dataset_dirs() + sorted(self.base_dir.glob("train-clean-*"))
+    
+    def _read_transcript_index(self, transcript_file: Path) -> Dict[str, str]:
+        """Parse a `{audio_id} {transcript}` file once and cache it."""
+        index = self._transcript_index.get(transcript_file)
+        if index is None:
+            index = {}
+            try:
+                with open(transcript_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        audio_id, _, text = line.partition(' ')
+                        index.setdefault(audio_id, text.strip())
+            except Exception as e:
+                print(f"⚠️ Error reading transcript {transcript_file}: {e}")
+            self._transcript_index[transcript_file] = index
+        return index
+    
     def find_transcript(self, audio_file: Path) -> Optional[str]:
         """Find corresponding transcript for audio file."""
         # LibriSpeech stores transcripts in .trans.txt files in the chapter directory
@@ -270,25 +503,18 @@ class LibriSpeechExtractor(MetadataExtractor):
         transcript_file = chapter_dir / f"{chapter_dir.name}.trans.txt"
         
         # Also check for alternative transcript file names
-        if not transcript_file.exists():
+        if transcript_file not in self._transcript_index and not transcript_file.exists():
             transcript_file = chapter_dir / f"{audio_file.stem}.txt"
-        if not transcript_file.exists():
-            transcript_file = chapter_dir.parent / f"{chapter_dir.name}.trans.txt"
+            if not transcript_file.exists():
+                transcript_file = chapter_dir.parent / f"{chapter_dir.name}.trans.txt"
         
-        if transcript_file.exists():
+        if transcript_file in self._transcript_index or transcript_file.exists():
             # Transcript file format: {audio_id} {transcript}
-            audio_id = audio_file.stem
-            try:
-                with open(transcript_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if line.startswith(audio_id):
-                            return line[len(audio_id):].strip()
-            except Exception as e:
-                print(f"⚠️ Error reading transcript {transcript_file}: {e}")
+            return self._read_transcript_index(transcript_file).get(audio_file.stem)
         
         return None
     
-    def extract(self) -> List[Dict]:
+    def extract(self) -> pd.DataFrame:
         # Try multiple possible folder names
         path = self.base_dir / self.dataset_name
         if not path.exists():
@@ -304,13 +530,14 @@ class LibriSpeechExtractor(MetadataExtractor):
                 path = train_folders[0]
         if not path.exists():
             print(f"⚠️ Skipping LibriSpeech, directory not found")
-            return []
+            return self.as_dataframe()
         
         print(f"🔍 Scanning LibriSpeech...")
-        audio_files = list(path.rglob("*.flac"))  # LibriSpeech uses FLAC
+        audio_files = find_files(path, (".flac",))  # LibriSpeech uses FLAC
+        to_abs = self.path_resolver(path)
         print(f"   Found {len(audio_files)} audio files")
         
-        for audio_file in tqdm(audio_files, desc="   Processing"):
+        for audio_file, (duration, sample_rate) in zip(audio_files, self.probe_audio(audio_files)):
             # Extract speaker from path: librispeech/{split}/{speaker}/...
             parts = audio_file.parts
             speaker_id = "unknown"
@@ -323,21 +550,19 @@ class LibriSpeechExtractor(MetadataExtractor):
             
             transcript = self.find_transcript(audio_file)
             
-            duration, sample_rate = self.get_audio_properties(str(audio_file))
-            
-            self.metadata_rows.append({
-                "audio_path": str(audio_file.resolve()),
-                "transcript": transcript,
-                "speaker_id": f"librispeech_{speaker_id}",
-                "emotion_label": "neutral",  # LibriSpeech is neutral reading
-                "language": "en",
-                "dataset_source": "librispeech",
-                "duration": duration,
-                "sample_rate": sample_rate,
-                "notes": None
-            })
+            self.add_row(
+                audio_path=to_abs(audio_file),
+                transcript=transcript,
+                speaker_id=f"librispeech_{speaker_id}",
+                emotion_label="neutral",  # LibriSpeech is neutral reading
+                language="en",
+                dataset_source="librispeech",
+                duration=duration,
+                sample_rate=sample_rate,
+                notes=None
+            )
         
-        return self.metadata_rows
+        return self.as_dataframe()
 
 
 class EmoVDBExtractor(MetadataExtractor):
@@ -347,7 +572,9 @@ class EmoVDBExtractor(MetadataExtractor):
     Supports: emovdb, emovdb_raw
     """
     
-    def extract(self) -> List[Dict]:
+    DIR_NAMES = ("emovdb", "emovdb_raw")
+    
+    def extract(self) -> pd.DataFrame:
         # Try multiple possible folder names
         path = self.base_dir / self.dataset_name
         if not path.exists():
@@ -356,13 +583,14 @@ class EmoVDBExtractor(MetadataExtractor):
             path = self.base_dir / "emovdb_raw"
         if not path.exists():
             print(f"⚠️ Skipping EmoV-DB, directory not found: {path}")
-            return []
+            return self.as_dataframe()
         
         print(f"🔍 Scanning EmoV-DB...")
-        audio_files = list(path.rglob("*.wav"))
-        
-        # Try to find JSON metadata file
-        json_files = list(path.rglob("*.json"))
+        # One walk for both the audio and any JSON metadata files
+        found = find_files(path, (".wav", ".json"))
+        to_abs = self.path_resolver(path)
+        audio_files = [f for f in found if f.suffix == ".wav"]
+        json_files = [f for f in found if f.suffix == ".json"]
         metadata_dict = {}
         
         if json_files:
@@ -379,9 +607,12 @@ class EmoVDBExtractor(MetadataExtractor):
                 except Exception as e:
                     print(f"⚠️ Error reading JSON {json_file}: {e}")
         
+        # Index by lower-cased basename once, so JSON keys given as paths or in another case still match
+        meta_by_name = {Path(k).name.lower(): v for k, v in metadata_dict.items() if isinstance(v, dict)}
+        
         print(f"   Found {len(audio_files)} audio files")
         
-        for audio_file in tqdm(audio_files, desc="   Processing"):
+        for audio_file, (duration, sample_rate) in zip(audio_files, self.probe_audio(audio_files)):
             filename = audio_file.name
             
             # Try to get metadata from JSON
@@ -389,8 +620,8 @@ class EmoVDBExtractor(MetadataExtractor):
             speaker_id = "unknown"
             transcript = None
             
-            if filename in metadata_dict:
-                meta = metadata_dict[filename]
+            meta = meta_by_name.get(filename.lower())
+            if meta is not None:
                 emotion = self.normalize_emotion(meta.get("emotion", "neutral"))
                 speaker_id = meta.get("speaker", "unknown")
                 transcript = meta.get("transcript")
@@ -398,31 +629,26 @@ class EmoVDBExtractor(MetadataExtractor):
                 # Fallback: parse filename
                 # EmoV-DB filenames often contain emotion in lowercase
                 filename_lower = filename.lower()
-                for emo_key, emo_val in EMOTION_MAP.items():
-                    if emo_key.lower() in filename_lower:
-                        emotion = emo_val
-                        break
+                emotion = next((emo_val for emo_key, emo_val in EMOTION_KEYWORDS if emo_key in filename_lower), emotion)
                 
                 # Try to extract speaker from filename
                 parts = filename.split("_")
                 if len(parts) > 0:
                     speaker_id = parts[0]
             
-            duration, sample_rate = self.get_audio_properties(str(audio_file))
-            
-            self.metadata_rows.append({
-                "audio_path": str(audio_file.resolve()),
-                "transcript": transcript,
-                "speaker_id": f"emovdb_{speaker_id}",
-                "emotion_label": emotion,
-                "language": "en",
-                "dataset_source": "emovdb",
-                "duration": duration,
-                "sample_rate": sample_rate,
-                "notes": None
-            })
+            self.add_row(
+                audio_path=to_abs(audio_file),
+                transcript=transcript,
+                speaker_id=f"emovdb_{speaker_id}",
+                emotion_label=emotion,
+                language="en",
+                dataset_source="emovdb",
+                duration=duration,
+                sample_rate=sample_rate,
+                notes=None
+            )
         
-        return self.metadata_rows
+        return self.as_dataframe()
 
 
 class ExpressoExtractor(MetadataExtractor):
@@ -432,14 +658,27 @@ class ExpressoExtractor(MetadataExtractor):
     Supports: expresso, expresso_dataset
     """
     
-    def extract(self) -> List[Dict]:
+    DIR_NAMES = ("expresso", "expresso_dataset")
+    AUDIO_PATH_COLUMNS = ["audio_path", "path", "file", "filepath", "audio"]
+    PARQUET_COLUMNS = frozenset(AUDIO_PATH_COLUMNS + ["transcript", "text", "speaker_id", "speaker",
+                                                      "emotion", "emotion_label", "language"])
+    
+    @staticmethod
+    def _coalesce_columns(df: pd.DataFrame, columns: List[str], default=None) -> List:
+        """Per row, the first truthy value among `columns` that exist in df (like `a or b or default`)."""
+        present = [df[col].tolist() for col in columns if col in df.columns]
+        if not present:
+            return [default] * len(df)
+        return [next((v for v in values if v), default) for values in zip(*present)]
+    
+    def extract(self) -> pd.DataFrame:
         # Try multiple possible folder names
         path = self.base_dir / "expresso"
         if not path.exists():
             path = self.base_dir / "expresso_dataset"
         if not path.exists():
             print(f"⚠️ Skipping Expresso, directory not found: {path}")
-            return []
+            return self.as_dataframe()
         
         print(f"🔍 Scanning Expresso...")
         
@@ -452,6 +691,7 @@ class ExpressoExtractor(MetadataExtractor):
             # Check if pyarrow is available
             try:
                 import pyarrow
+                import pyarrow.parquet
                 pyarrow_available = True
             except ImportError:
                 print("   ⚠️ pyarrow not installed. Install with: pip install pyarrow")
@@ -460,22 +700,27 @@ class ExpressoExtractor(MetadataExtractor):
             if pyarrow_available:
                 for pq_file in parquet_files:
                     try:
-                        df_pq = pd.read_parquet(pq_file)
+                        # Read only the columns we map; some parquets also carry inline waveforms/embeddings
+                        schema_names = pyarrow.parquet.ParquetFile(pq_file).schema_arrow.names
+                        wanted = [col for col in schema_names if col in self.PARQUET_COLUMNS]
+                        df_pq = pd.read_parquet(pq_file, columns=wanted, engine="pyarrow", use_threads=True)
                         print(f"   Processing {pq_file.name} with {len(df_pq)} entries")
                         
-                        # Map parquet columns to our format
-                        for _, row in df_pq.iterrows():
-                            audio_path_col = None
-                            for col in ["audio_path", "path", "file", "filepath", "audio"]:
-                                if col in df_pq.columns:
-                                    audio_path_col = col
-                                    break
-                            
-                            if audio_path_col is None:
-                                continue
-                            
+                        audio_path_col = next((col for col in self.AUDIO_PATH_COLUMNS if col in df_pq.columns), None)
+                        if audio_path_col is None:
+                            continue
+                        
+                        # Map parquet columns to our format column-wise; durations are probed in one batch afterwards
+                        transcripts = self._coalesce_columns(df_pq, ["transcript", "text"])
+                        speakers = self._coalesce_columns(df_pq, ["speaker_id", "speaker"], "unknown")
+                        emotions_raw = [str(e) for e in self._coalesce_columns(df_pq, ["emotion", "emotion_label"], "neutral")]
+                        languages = self._coalesce_columns(df_pq, ["language"], "en")
+                        emotion_lut = {raw: self.normalize_emotion(raw) for raw in set(emotions_raw)}
+                        
+                        pq_rows, pq_audio = [], []
+                        for audio_rel_path, transcript, speaker_id, emotion_raw, language in zip(
+                                df_pq[audio_path_col].tolist(), transcripts, speakers, emotions_raw, languages):
                             # Resolve audio file path
-                            audio_rel_path = row[audio_path_col]
                             audio_file = path / audio_rel_path if not os.path.isabs(audio_rel_path) else Path(audio_rel_path)
                             
                             if not audio_file.exists():
@@ -484,58 +729,276 @@ class ExpressoExtractor(MetadataExtractor):
                                 if not audio_file.exists():
                                     continue
                             
-                            # Extract metadata from parquet
-                            transcript = row.get("transcript") or row.get("text") or None
-                            speaker_id = str(row.get("speaker_id") or row.get("speaker") or "unknown")
-                            emotion_raw = row.get("emotion") or row.get("emotion_label") or "neutral"
-                            emotion = self.normalize_emotion(str(emotion_raw))
-                            language = row.get("language") or "en"
-                            
-                            duration, sample_rate = self.get_audio_properties(str(audio_file))
-                            
-                            self.metadata_rows.append({
-                                "audio_path": str(audio_file.resolve()),
-                                "transcript": transcript,
-                                "speaker_id": f"expresso_{speaker_id}",
-                                "emotion_label": emotion,
-                                "language": language,
-                                "dataset_source": "expresso",
-                                "duration": duration,
-                                "sample_rate": sample_rate,
-                                "notes": None
-                            })
+                            pq_audio.append(audio_file)
+                            pq_rows.append((transcript, speaker_id, emotion_lut[emotion_raw], language))
+                        
+                        for audio_file, (transcript, speaker_id, emotion, language), (duration, sample_rate) in zip(
+                                pq_audio, pq_rows, self.probe_audio(pq_audio)):
+                            self.add_row(
+                                audio_path=str(audio_file.resolve()),
+                                transcript=transcript,
+                                speaker_id=f"expresso_{speaker_id}",
+                                emotion_label=emotion,
+                                language=language,
+                                dataset_source="expresso",
+                                duration=duration,
+                                sample_rate=sample_rate,
+                                notes=None
+                            )
                     except Exception as e:
                         print(f"⚠️ Error processing parquet {pq_file}: {e}")
         
         # Fallback to direct audio file scanning if no parquet or pyarrow unavailable
         if not parquet_files or not pyarrow_available:
             # Fallback: scan audio files directly
-            audio_files = list(path.rglob("*.wav")) + list(path.rglob("*.flac"))
+            audio_files = find_files(path, (".wav", ".flac"))
+            to_abs = self.path_resolver(path)
             print(f"   No parquet files found, scanning {len(audio_files)} audio files directly")
             
-            for audio_file in tqdm(audio_files, desc="   Processing"):
-                duration, sample_rate = self.get_audio_properties(str(audio_file))
-                
-                self.metadata_rows.append({
-                    "audio_path": str(audio_file.resolve()),
-                    "transcript": None,
-                    "speaker_id": "unknown",
-                    "emotion_label": "neutral",
-                    "language": "en",
-                    "dataset_source": "expresso",
-                    "duration": duration,
-                    "sample_rate": sample_rate,
-                    "notes": None
-                })
+            for audio_file, (duration, sample_rate) in zip(audio_files, self.probe_audio(audio_files)):
+                self.add_row(
+                    audio_path=to_abs(audio_file),
+                    transcript=None,
+                    speaker_id="unknown",
+                    emotion_label="neutral",
+                    language="en",
+                    dataset_source="expresso",
+                    duration=duration,
+                    sample_rate=sample_rate,
+                    notes=None
+                )
         
-        return self.metadata_rows
+        return self.as_dataframe()
 
 
 # ===========================================
 # MAIN PROCESSING
 # ===========================================
 
-def create_metadata(data_dir: str, output_dir: str = None):
+# Arrow schema for the Parquet export (fixed, so all-null columns in one dataset don't change types)
+PARQUET_SCHEMA_FIELDS = [
+    ("audio_path", "string"), ("transcript", "string"), ("speaker_id", "string"),
+    ("emotion_label", "string"), ("language", "string"), ("dataset_source", "string"),
+    ("duration", "float64"), ("sample_rate", "int64"), ("notes", "string"),
+]
+
+
+# --format choices and the file each one produces
+OUTPUT_FILES = {
+    "parquet": "metadata_unified.parquet",
+    "feather": "metadata_unified.feather",
+    "csv": "metadata_unified.csv",
+}
+
+
+class MetadataWriter:
+    """Streams each dataset's metadata to Parquet/Feather/CSV and keeps running summary counts.
+    
+    Rows are written one dataset at a time and not retained (Feather keeps compact Arrow
+    buffers until close()); the summary is built from counters.
+    """
+    
+    def __init__(self, output_dir: Path, fmt: str = "parquet"):
+        self.output_dir = output_dir
+        self.format = fmt
+        self.output_path = output_dir / OUTPUT_FILES[fmt]
+        self._file = None
+        self._writer = None
+        self._schema = None
+        
+        self.total_files = 0
+        self.duration_sum = 0.0
+        self.duration_count = 0
+        self.transcripts = 0
+        self.languages = Counter()
+        self.datasets = Counter()
+        self.emotions = Counter()
+        self.speakers = set()
+    
+    def write(self, df: pd.DataFrame):
+        # Remove rows with invalid audio paths
+        initial_count = len(df)
+        df = df[df["audio_path"].notna()].copy()
+        if len(df) < initial_count:
+            print(f"⚠️ Removed {initial_count - len(df)} rows with invalid audio paths")
+        df["sample_rate"] = df["sample_rate"].astype("Int64")
+        
+        table = self._to_arrow(df)
+        if table is None:
+            self._write_pandas_csv(df)
+        elif self.format == "parquet":
+            self._write_parquet(table)
+        elif self.format == "feather":
+            self._write_feather(table)
+        else:
+            self._write_csv(table)
+        
+        durations = df["duration"].dropna()
+        self.total_files += len(df)
+        self.duration_sum += float(durations.sum())
+        self.duration_count += len(durations)
+        self.transcripts += int(df["transcript"].notna().sum())
+        self.languages.update(self._counts(df["language"]))
+        self.datasets.update(self._counts(df["dataset_source"]))
+        self.emotions.update(self._counts(df["emotion_label"]))
+        self.speakers.update(df["speaker_id"].dropna().unique())
+    
+    @staticmethod
+    def _counts(column: pd.Series) -> Dict[str, int]:
+        # Categoricals report unused categories as 0; keep only labels that occur
+        counts = column.value_counts()
+        return {str(k): int(v) for k, v in counts[counts > 0].items()}
+    
+    def _to_arrow(self, df: pd.DataFrame):
+        """Convert one dataset's rows to an Arrow table, or None when pyarrow is missing."""
+        if self._schema is False:
+            return None
+        try:
+            import pyarrow as pa
+        except ImportError:
+            if self.format != "csv":
+                print(f"   ⚠️ pyarrow not installed, writing CSV instead of {self.format}")
+                self.format = "csv"
+                self.output_path = self.output_dir / OUTPUT_FILES["csv"]
+            self._schema = False
+            return None
+        if self._schema is None:
+            self._schema = pa.schema([
+                (name, pa.dictionary(pa.int32(), pa.string()) if name in CATEGORICAL_COLUMNS else pa.type_for_alias(t))
+                for name, t in PARQUET_SCHEMA_FIELDS
+            ])
+        return pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+    
+    def _write_pandas_csv(self, df: pd.DataFrame):
+        # No pyarrow: pandas' Python-level writer
+        df.to_csv(self.output_path, index=False, encoding='utf-8',
+                  mode='a' if self.total_files else 'w', header=not self.total_files)
+    
+    def _write_csv(self, table):
+        if self._writer is None:
+            import pyarrow.csv as pa_csv
+            self._file = open(self.output_path, 'wb')
+            self._file.write((",".join(METADATA_COLUMNS) + "\n").encode('utf-8'))
+            self._writer = pa_csv.CSVWriter(
+                self._file, table.schema,
+                write_options=pa_csv.WriteOptions(include_header=False, quoting_style="needed"),
+            )
+        self._writer.write_table(table)
+    
+    def _write_parquet(self, table):
+        if self._writer is None:
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(self.output_path, table.schema, compression="zstd")
+        self._writer.write_table(table)
+    
+    def _write_feather(self, table):
+        # Arrow IPC files allow one dictionary per field, so per-dataset tables (each with its
+        # own label dictionary) are kept as compact Arrow buffers and unified once in close()
+        if self._writer is None:
+            self._writer = []
+        self._writer.append(table)
+    
+    def close(self):
+        if self.format == "feather" and self._writer:
+            import pyarrow as pa
+            import pyarrow.feather as feather
+            table = pa.concat_tables(self._writer).unify_dictionaries().combine_chunks()
+            feather.write_feather(table, self.output_path, compression="zstd")
+        elif self._writer is not None:
+            self._writer.close()
+        self._writer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def summary(self) -> Dict:
+        total_hours = round(self.duration_sum / 3600, 2) if self.duration_count else 0.0
+        avg_duration = round(self.duration_sum / self.duration_count, 2) if self.duration_count else 0.0
+        return {
+            "total_files": self.total_files,
+            "total_hours": total_hours,
+            "total_minutes": round(total_hours * 60, 2),
+            "average_duration_seconds": avg_duration,
+            "languages": dict(self.languages.most_common()),
+            "datasets": dict(self.datasets.most_common()),
+            "emotions": dict(self.emotions.most_common()),
+            "speakers_count": len(self.speakers),
+            "transcripts_available": self.transcripts,
+            "transcripts_percentage": round(self.transcripts / self.total_files * 100, 2),
+        }
+
+
+# Extractor results are reused across runs while their dataset folders are unchanged
+METADATA_CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "sonora" / "metadata"
+# Bump when extractor output changes, so stale cached results are not reused
+METADATA_CACHE_VERSION = 1
+
+
+def dataset_fingerprint(dirs: List[Path]) -> str:
+    """Cheap change detector for one dataset: each folder's mtime plus its top-level entries.
+    
+    Only the top level is read, so this stays O(datasets) rather than O(files). Adding, removing or
+    renaming a top-level entry changes the folder mtime; edits deeper down are not seen (--no-cache).
+    """
+    parts = []
+    for root in dirs:
+        try:
+            count = 0
+            newest = os.stat(root).st_mtime_ns
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    count += 1
+                    newest = max(newest, entry.stat(follow_symlinks=False).st_mtime_ns)
+        except OSError:
+            continue  # folder absent or unreadable
+        parts.append(f"{root.name}:{count}:{newest}")
+    return hashlib.blake2b("|".join(parts).encode(), digest_size=8).hexdigest()
+
+
+def _cached_extract(name: str, extractor: MetadataExtractor, use_cache: bool) -> pd.DataFrame:
+    """extractor.extract(), served from the on-disk cache when its dataset folders are unchanged."""
+    if not use_cache:
+        return extractor.extract()
+    key = hashlib.blake2b(
+        f"{METADATA_CACHE_VERSION}|{type(extractor).__name__}|{os.path.realpath(extractor.base_dir)}"
+        f"|{extractor.dataset_name}".encode(),
+        digest_size=8,
+    ).hexdigest()
+    fingerprint = dataset_fingerprint(extractor.dataset_dirs())
+    cache_file = METADATA_CACHE_DIR / f"{name}-{key}-{fingerprint}.pkl"
+    if cache_file.exists():
+        try:
+            rows = pd.read_pickle(cache_file)
+            print(f"♻️ {name}: data unchanged, reusing {len(rows)} cached rows")
+            return rows
+        except Exception as e:
+            print(f"⚠️ Ignoring metadata cache {cache_file}: {e}")
+    
+    rows = extractor.extract()
+    try:
+        METADATA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in METADATA_CACHE_DIR.glob(f"{name}-{key}-*.pkl"):
+            stale.unlink()
+        rows.to_pickle(cache_file)
+    except Exception as e:
+        print(f"⚠️ Could not write metadata cache {cache_file}: {e}")
+    return rows
+
+
+def _extract_unless_found(name: str, extractor: MetadataExtractor, use_cache: bool,
+                          base_job=None) -> Optional[pd.DataFrame]:
+    """Run the (cached) extraction, or skip it (None) when base_job already found files."""
+    if base_job is not None:
+        try:
+            base_rows = base_job.result()
+        except Exception:
+            base_rows = None
+        if base_rows is not None and len(base_rows):
+            return None
+    return _cached_extract(name, extractor, use_cache)
+
+
+def create_metadata(data_dir: str, output_dir: str = None, fmt: str = "parquet", use_cache: bool = True):
     """Main function to create unified metadata."""
     
     if output_dir is None:
@@ -568,117 +1031,87 @@ def create_metadata(data_dir: str, output_dir: str = None):
         "expresso_dataset": ExpressoExtractor(data_dir, "expresso_dataset"),
     }
     
-    all_metadata = []
+    writer = MetadataWriter(output_dir, fmt)
     
-    # Extract from each dataset
-    processed_datasets = set()
-    for name, extractor in extractors.items():
-        # Skip duplicate processing for alternative folder names
-        # Only process if we haven't found files for the base name
-        if name == "jvs_ver1" and "jvs" in processed_datasets:
-            continue
-        if name == "libri" and "librispeech" in processed_datasets:
-            continue
-        if name == "emovdb_raw" and "emovdb" in processed_datasets:
-            continue
-        
+    # Alternative folder names only run if their base name found no files
+    alternates = {"jvs_ver1": "jvs", "libri": "librispeech", "emovdb_raw": "emovdb"}
+    
+    # Dataset scans are independent and I/O-bound, so up to EXTRACT_WORKERS run concurrently; an
+    # alternate waits on its base job. Results are written in dict order and dropped straight
+    # after, and at most EXTRACT_WORKERS jobs are in flight, so that many datasets' rows at most
+    # are held at once.
+    jobs = {}
+    pending = deque()
+    
+    def write_next():
+        name = pending.popleft()
         try:
-            rows = extractor.extract()
-            if rows:  # Only record if we found files
-                all_metadata.extend(rows)
+            rows = jobs.pop(name).result()
+            if rows is not None and len(rows):  # Only record if we found files
+                writer.write(rows)
                 print(f"✅ {name}: {len(rows)} files processed\n")
-                processed_datasets.add(name)
-                # Also mark base name as processed
-                if name == "jvs_ver1":
-                    processed_datasets.add("jvs")
-                elif name == "libri":
-                    processed_datasets.add("librispeech")
-                elif name == "emovdb_raw":
-                    processed_datasets.add("emovdb")
         except Exception as e:
             print(f"❌ Error processing {name}: {e}\n")
-            continue
+        finally:
+            extractors[name].columns = {col: [] for col in METADATA_COLUMNS}
     
-    if not all_metadata:
-        print("❌ No metadata extracted! Check data directory paths.")
-        return
+    with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as ex:
+        for name, extractor in extractors.items():
+            # Alternates directly follow their base, which is still in the window here
+            base = jobs.get(alternates.get(name))
+            jobs[name] = ex.submit(_extract_unless_found, name, extractor, use_cache, base)
+            pending.append(name)
+            if len(pending) > EXTRACT_WORKERS:
+                write_next()
+        while pending:
+            write_next()
     
-    # Create DataFrame
-    print(f"📊 Creating unified metadata DataFrame...")
-    df = pd.DataFrame(all_metadata)
+    writer.close()
     
-    # Ensure all required columns exist
-    required_columns = ["audio_path", "transcript", "speaker_id", "emotion_label", 
-                       "language", "dataset_source", "duration", "sample_rate", "notes"]
-    for col in required_columns:
-        if col not in df.columns:
-            df[col] = None
+    if not writer.total_files:
+        print("❌ No metadata extracted! Check data directory paths.")
+        return
     
-    # Remove rows with invalid audio paths
-    initial_count = len(df)
-    df = df[df["audio_path"].notna()].copy()
-    if len(df) < initial_count:
-        print(f"⚠️ Removed {initial_count - len(df)} rows with invalid audio paths")
+    print(f"✅ Exported {writer.format.upper()}: {writer.output_path}")
     
     # Create summary statistics
     print("📈 Computing summary statistics...")
-    
-    valid_durations = df["duration"].dropna()
-    total_hours = round(valid_durations.sum() / 3600, 2) if len(valid_durations) > 0 else 0.0
-    avg_duration = round(valid_durations.mean(), 2) if len(valid_durations) > 0 else 0.0
-    
-    summary = {
-        "total_files": int(len(df)),
-        "total_hours": total_hours,
-        "total_minutes": round(total_hours * 60, 2),
-        "average_duration_seconds": avg_duration,
-        "languages": df["language"].value_counts().to_dict(),
-        "datasets": df["dataset_source"].value_counts().to_dict(),
-        "emotions": df["emotion_label"].value_counts().to_dict(),
-        "speakers_count": int(df["speaker_id"].nunique()),
-        "transcripts_available": int(df["transcript"].notna().sum()),
-        "transcripts_percentage": round(df["transcript"].notna().sum() / len(df) * 100, 2),
-    }
-    
-    # Export CSV
-    csv_path = output_dir / "metadata_unified.csv"
-    df.to_csv(csv_path, index=False, encoding='utf-8')
-    print(f"✅ Exported CSV: {csv_path}")
+    summary = writer.summary()
+    total_files = summary["total_files"]
     
     # Export JSON summary
     json_path = output_dir / "metadata_summary.json"
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
+    summary_json = json_pretty(summary)
+    with open(json_path, 'wb') as f:
+        f.write(summary_json)
     print(f"✅ Exported summary: {json_path}")
     
     # Print summary
     print("\n" + "=" * 60)
     print("📊 METADATA SUMMARY")
     print("=" * 60)
-    print(json.dumps(summary, indent=2, ensure_ascii=False))
+    print(summary_json.decode('utf-8'))
     print()
     
     # Print emotion distribution
     print("🎭 EMOTION DISTRIBUTION:")
     print("-" * 60)
-    emotion_counts = df["emotion_label"].value_counts().sort_index()
-    for emotion, count in emotion_counts.items():
-        percentage = round(count / len(df) * 100, 1)
+    for emotion, count in sorted(writer.emotions.items()):
+        percentage = round(count / total_files * 100, 1)
         print(f"  {emotion:15} {count:6} files ({percentage:5.1f}%)")
     print()
     
     # Print dataset distribution
     print("📚 DATASET DISTRIBUTION:")
     print("-" * 60)
-    dataset_counts = df["dataset_source"].value_counts()
-    for dataset, count in dataset_counts.items():
-        percentage = round(count / len(df) * 100, 1)
+    for dataset, count in writer.datasets.most_common():
+        percentage = round(count / total_files * 100, 1)
         print(f"  {dataset:15} {count:6} files ({percentage:5.1f}%)")
     print()
     
     print("=" * 60)
     print("🎯 Metadata creation complete! Ready for fine-tuning.")
-    print(f"   Metadata CSV: {csv_path}")
+    print(f"   Metadata {writer.format.upper()}: {writer.output_path}")
     print(f"   Summary JSON: {json_path}")
     print("=" * 60)
 
@@ -691,6 +1124,7 @@ def main():
 Examples:
   python create_voice_metadata.py --data-dir ./data
   python create_voice_metadata.py --data-dir /content/data --output-dir ./output
+  python create_voice_metadata.py --data-dir ./data --format csv
         """
     )
     parser.add_argument(
@@ -705,10 +1139,21 @@ Examples:
         default=None,
         help="Output directory for metadata files (default: current directory)"
     )
+    parser.add_argument(
+        "--format",
+        choices=sorted(OUTPUT_FILES),
+        default="parquet",
+        help="Metadata file format (default: parquet; csv for compatibility)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-extract every dataset even if its folder looks unchanged (cache: {METADATA_CACHE_DIR})"
+    )
     
     args = parser.parse_args()
     
-    create_metadata(args.data_dir, args.output_dir)
+    create_metadata(args.data_dir, args.output_dir, args.format, use_cache=not args.no_cache)
 
 
 if __name__ == "__main__":
@@ -1,20 +1,44 @@
-import os, csv, json, soundfile as sf
-from glob import glob
+import os, re, csv, json, soundfile as sf
 from pathlib import Path
+from collections import Counter
 from tqdm import tqdm
+from concurrent.futures import ThreadPoolExecutor
+
+# Prefer orjson for the summary dump
+try:
+    import orjson
+    def json_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def json_pretty(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+# Header reads are I/O bound and libsndfile releases the GIL, so threads overlap them
+PROBE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+AUDIO_EXTS = {'wav', 'flac', 'mp3', 'm4a'}
 
 out_dir = "./output"
 os.makedirs(out_dir, exist_ok=True)
 csv_path = os.path.join(out_dir, "metadata_unified.csv")
 json_path = os.path.join(out_dir, "metadata_summary.json")
 
-rows = []
+fieldnames = ["audio_path","transcript","speaker_id","emotion_label","language","dataset_source","duration","sample_rate","notes"]
+
+# Running counts; rows go straight to the CSV instead of being held in memory
+dataset_counts = Counter()
+language_counts = Counter()
+datasets = []
+
+# Emotion keywords in priority order (the first keyword found anywhere in the name wins). The
+# long forms (happy, angry, fear, ...) always contain an earlier short code, so those are enough.
+# Each alternative scans the whole name before the next is tried, so one regex search keeps
+# that priority while running entirely in C.
+EMOTION_CODES = ["ANG", "DIS", "FEA", "HAP", "NEU", "SAD", "SUR", "CALM"]
+EMO_RE = re.compile("^(?:" + "|".join(f".*?({code})" for code in EMOTION_CODES) + ")", re.I | re.S)
 
 def detect_emotion(name):
-    for emo in ["ANG", "DIS", "FEA", "HAP", "NEU", "SAD", "SUR", "calm", "happy", "sad", "angry", "fear", "disgust", "neutral"]:
-        if emo.lower() in name.lower(): 
-            return emo.upper()
-    return ""
+    m = EMO_RE.match(name)
+    return EMOTION_CODES[m.lastindex - 1] if m else ""
 
 def detect_language(dataset):
     if "libri" in dataset: 
@@ -23,91 +47,163 @@ def detect_language(dataset):
         return "Japanese"
     return "English"
 
-def parse_transcript(path):
-    txt_file = os.path.splitext(path)[0] + ".txt"
-    if os.path.exists(txt_file):
+def _scan_dataset(root):
+    """Audio files and .txt files under root, from one scandir pass (d_type from readdir, no stat per entry)."""
+    audio_files, txt_files = [], []
+    stack = [root]
+    while stack:
+        d = stack.pop()
         try:
-            return open(txt_file, "r", encoding="utf-8").read().strip()
-        except: 
+            with os.scandir(d) as it:
+                for e in it:
+                    if e.name.startswith('.'):
+                        continue  # glob('**') never descended into hidden entries either
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(e.path)
+                        continue
+                    ext = e.name.rpartition('.')[2].lower()
+                    if ext in AUDIO_EXTS:
+                        audio_files.append(e.path)
+                    elif ext == 'txt':
+                        txt_files.append(e.path)
+        except OSError:
             pass
-    return ""
+    return audio_files, txt_files
 
-for dataset_dir in os.listdir("./data"):
-    ds_path = os.path.join("./data", dataset_dir)
-    if not os.path.isdir(ds_path): 
-        continue
-    print(f"Scanning {dataset_dir}...")
-    
-    # Search for all audio formats
-    audio_extensions = ['.wav', '.flac', '.mp3', '.m4a']
-    audio_files = []
-    for ext in audio_extensions:
-        audio_files.extend(glob(os.path.join(ds_path, "**", f"*{ext}"), recursive=True))
-    
-    print(f"  Found {len(audio_files)} audio files")
+def _read_text(path):
+    """Whole-file UTF-8 read with raw os.read calls; transcripts are one read, no TextIOWrapper stack."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks).decode("utf-8")
+
+def _build_transcript_index(txt_files):
+    """Map audio path without extension -> transcript, reading each .txt once.
     
-    # Process with progress bar for large datasets
-    for audio_path in tqdm(audio_files, desc=f"  Processing {dataset_dir}", leave=False):
+    Sidecar files (<name>.txt next to <name>.wav) map one-to-one; LibriSpeech *.trans.txt
+    files hold "<utterance-id> <text>" lines for every file in their directory.
+    """
+    index = {}
+    for txt_file in txt_files:
         try:
-            # Use soundfile for WAV/FLAC, librosa for MP3/M4A
-            audio_ext = os.path.splitext(audio_path)[1].lower()
-            if audio_ext in ['.wav', '.flac']:
-                info = sf.info(audio_path)
-                duration = round(info.duration, 2)
-                sample_rate = info.samplerate
-            else:
-                # Use librosa for MP3/M4A (handles more formats)
-                try:
-                    import librosa
-                    y, sr = librosa.load(audio_path, sr=None, duration=300)  # Limit to 5min for speed
-                    duration = round(librosa.get_duration(y=y, sr=sr), 2)
-                    sample_rate = sr
-                except ImportError:
-                    # Fallback: try soundfile anyway
-                    info = sf.info(audio_path)
-                    duration = round(info.duration, 2)
-                    sample_rate = info.samplerate
-            
-            transcript = parse_transcript(audio_path)
-            emotion = detect_emotion(os.path.basename(audio_path))
-            lang = detect_language(dataset_dir)
-            
-            # Extract speaker ID from filename
-            basename = os.path.basename(audio_path)
-            speaker_id = basename.split("_")[0] if "_" in basename else "unknown"
-            
-            rows.append({
-                "audio_path": audio_path,
-                "transcript": transcript,
-                "speaker_id": speaker_id,
-                "emotion_label": emotion,
-                "language": lang,
-                "dataset_source": dataset_dir,
-                "duration": duration,
-                "sample_rate": sample_rate,
-                "notes": "",
-            })
-        except Exception as e:
-            print(f"Error on {audio_path}: {e}")
-
-# --- WRITE OUTPUT ---
-fieldnames = ["audio_path","transcript","speaker_id","emotion_label","language","dataset_source","duration","sample_rate","notes"]
+            text = _read_text(txt_file)
+        except (OSError, UnicodeDecodeError):
+            continue
+        if txt_file.endswith(".trans.txt"):
+            folder = os.path.dirname(txt_file)
+            for line in text.splitlines():
+                utt_id, _, utterance = line.strip().partition(" ")
+                if utt_id:
+                    index[os.path.join(folder, utt_id)] = utterance
+        else:
+            index[os.path.splitext(txt_file)[0]] = text.strip()
+    return index
+
+def _header_torchaudio(audio_path):
+    import torchaudio
+    info = torchaudio.info(audio_path)
+    return info.num_frames / info.sample_rate, info.sample_rate
+
+def _header_soundfile(audio_path):
+    info = sf.info(audio_path)
+    return info.duration, info.samplerate
+
+def _header_librosa(audio_path):
+    import librosa
+    return librosa.get_duration(path=audio_path), librosa.get_samplerate(audio_path)
+
+def _audio_header(audio_path):
+    """(duration, sample_rate) from the container header, without decoding samples."""
+    audio_ext = os.path.splitext(audio_path)[1].lower()
+    if audio_ext in ['.wav', '.flac']:
+        readers = [_header_soundfile]
+    else:
+        # MP3/M4A: torchaudio reads the header; libsndfile>=1.1 handles MP3; librosa last
+        readers = [_header_torchaudio, _header_soundfile, _header_librosa]
+    for reader in readers[:-1]:
+        try:
+            duration, sample_rate = reader(audio_path)
+            return round(duration, 2), sample_rate
+        except Exception:
+            continue
+    duration, sample_rate = readers[-1](audio_path)
+    return round(duration, 2), sample_rate
+
+def _probe_one(audio_path, dataset_dir, lang, transcripts):
+    """Read one file's header and build its metadata row; None on failure."""
+    try:
+        duration, sample_rate = _audio_header(audio_path)
+
+        transcript = transcripts.get(os.path.splitext(audio_path)[0], "")
+
+        # Extract speaker ID from filename
+        basename = os.path.basename(audio_path)
+        emotion = detect_emotion(basename)
+        speaker_id = basename.split("_")[0] if "_" in basename else "unknown"
+
+        return {
+            "audio_path": audio_path,
+            "transcript": transcript,
+            "speaker_id": speaker_id,
+            "emotion_label": emotion,
+            "language": lang,
+            "dataset_source": dataset_dir,
+            "duration": duration,
+            "sample_rate": sample_rate,
+            "notes": "",
+        }
+    except Exception as e:
+        print(f"Error on {audio_path}: {e}")
+        return None
 
 with open(csv_path, "w", newline="", encoding="utf-8") as f:
-    writer = csv.DictWriter(f, fieldnames=fieldnames)
-    writer.writeheader()
-    if rows:
-        writer.writerows(rows)
+    writer = csv.writer(f)
+    writer.writerow(fieldnames)
+
+    for dataset_dir in os.listdir("./data"):
+        ds_path = os.path.join("./data", dataset_dir)
+        if not os.path.isdir(ds_path): 
+            continue
+        datasets.append(dataset_dir)
+        print(f"Scanning {dataset_dir}...")
+    
+        # Search for all audio formats (and transcripts) in a single walk
+        audio_files, txt_files = _scan_dataset(ds_path)
+        transcripts = _build_transcript_index(txt_files)
+    
+        print(f"  Found {len(audio_files)} audio files")
+        lang = detect_language(dataset_dir)
+    
+        # Process with progress bar for large datasets
+        with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as ex:
+            probed = ex.map(lambda p: _probe_one(p, dataset_dir, lang, transcripts), audio_files)
+            for row in tqdm(probed, total=len(audio_files), desc=f"  Processing {dataset_dir}", leave=False):
+                if row:
+                    writer.writerow([row[k] for k in fieldnames])
+                    dataset_counts[dataset_dir] += 1
+                    language_counts[lang] += 1
 
+# --- WRITE SUMMARY ---
+total_files = sum(dataset_counts.values())
 summary = {
-    "total_files": len(rows),
-    "datasets": [d for d in os.listdir("./data") if os.path.isdir(os.path.join("./data", d))],
-    "status": "completed" if rows else "no audio found"
+    "total_files": total_files,
+    "datasets": datasets,
+    "files_per_dataset": dict(dataset_counts),
+    "files_per_language": dict(language_counts),
+    "status": "completed" if total_files else "no audio found"
 }
 
-json.dump(summary, open(json_path, "w", encoding="utf-8"), indent=2)
+with open(json_path, "wb") as f:
+    f.write(json_pretty(summary))
 
 print(f"\n✅ Metadata written: {csv_path}")
 print(f"✅ Summary: {json_path}")
-print(f"📊 Total files processed: {len(rows)}")
+print(f"📊 Total files processed: {total_files}")
 
@@ -5,15 +5,22 @@ from pathlib import Path
 output_dir = Path('output')
 zip_path = Path('sonora_voice_metadata_full.zip')
 
+# Already-compressed artifacts gain nothing from deflate; store them as-is
+STORED_SUFFIXES = {'.parquet', '.feather', '.zst', '.gz', '.zip', '.mp3', '.m4a', '.flac'}
+
 if not output_dir.exists():
     print(f"[ERROR] Output directory not found: {output_dir}")
     exit(1)
 
-with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+# Level 1 deflate: nearly the same ratio on CSV/JSON text for a fraction of level 6's CPU
+with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
     files_added = 0
     for file in output_dir.glob('*'):
         if file.is_file():
-            zipf.write(file, file.name)
+            if file.suffix.lower() in STORED_SUFFIXES:
+                zipf.write(file, file.name, compress_type=zipfile.ZIP_STORED)
+            else:
+                zipf.write(file, file.name)
             print(f'  Added: {file.name}')
             files_added += 1
 
@@ -5,36 +5,36 @@ try:
 except ImportError:
     HAS_PYANNOTE = False
 import os
+import functools
 import tempfile
 import ffmpeg
+import numpy as np
+import soundfile as sf
 import logging
 import json
 import random
+from collections import namedtuple
 from typing import List, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
-# Single instance of the pipeline
-_pipeline = None
-
 def get_pipeline(token: str = None):
     """Get or create the speaker diarization pipeline."""
-    global _pipeline
-    if _pipeline is None:
-        try:
-            hf_token = token or os.getenv("PYANNOTE_TOKEN") or os.getenv("HF_TOKEN")
-            
-            if HAS_PYANNOTE and hf_token:
-                logger.info("Initializing Pyannote Pipeline with Token...")
-                _pipeline = Pipeline.from_pretrained("pyannote/speaker-diarization-3.1", use_auth_token=hf_token)
-            else:
-                logger.warning("No HuggingFace token found. Defaulting to Fallback/Mock Mode.")
-                _pipeline = MockDiarizationPipeline()
-        except Exception as e:
-            logger.error(f"Failed to load pyannote pipeline: {e}")
-            logger.info("Falling back to mock diarization pipeline")
-            _pipeline = MockDiarizationPipeline()
-    return _pipeline
+    hf_token = token or os.getenv("PYANNOTE_TOKEN") or os.getenv("HF_TOKEN") or ""
+    return _build_pipeline(hf_token)
+
+@functools.lru_cache(maxsize=2)
+def _build_pipeline(hf_token: str):
+    """One pipeline per token for the life of the process (the pyannote load takes seconds)."""
+    try:
+        if HAS_PYANNOTE and hf_token:
+            logger.info("Initializing Pyannote Pipeline with Token...")
+            return Pipeline.from_pretrained("pyannote/speaker-diarization-3.1", use_auth_token=hf_token)
+        logger.warning("No HuggingFace token found. Defaulting to Fallback/Mock Mode.")
+    except Exception as e:
+        logger.error(f"Failed to load pyannote pipeline: {e}")
+        logger.info("Falling back to mock diarization pipeline")
+    return MockDiarizationPipeline()
 
 class MockDiarizationPipeline:
     """Mock pipeline for testing when pyannote is not available."""
@@ -57,19 +57,28 @@ class MockDiarizationPipeline:
 class MockDiarizationResult:
     def __init__(self, segments):
         self.segments = segments
+        # Built once so repeated itertracks() calls don't allocate a turn per segment
+        self._tracks = tuple(
+            (MockTurn(segment["start"], segment["end"]), None, segment["speaker"])
+            for segment in segments
+        )
     
     def itertracks(self, yield_label=True):
-        for segment in self.segments:
-            turn = MockTurn(segment["start"], segment["end"])
-            yield turn, None, segment["speaker"]
+        return iter(self._tracks)
 
-class MockTurn:
-    def __init__(self, start, end):
-        self.start = start
-        self.end = end
+MockTurn = namedtuple("MockTurn", "start end")
 
 def extract_audio_from_video(video_path: str, out_audio: str = None, sr: int = 16000) -> str:
     """Extract audio from video file for diarization."""
+    # Already in the target format: a header probe is enough, no ffmpeg decode/encode
+    if video_path.lower().endswith(".wav"):
+        try:
+            info = sf.info(video_path)
+            if info.samplerate == sr and info.channels == 1:
+                return video_path
+        except Exception:
+            pass  # unreadable header: let ffmpeg try
+    
     if out_audio is None:
         fd, out_audio = tempfile.mkstemp(suffix=".wav")
         os.close(fd)
@@ -77,7 +86,7 @@ def extract_audio_from_video(video_path: str, out_audio: str = None, sr: int = 1
     try:
         (
             ffmpeg.input(video_path)
-            .output(out_audio, ac=1, ar=sr, format='wav')
+            .output(out_audio, vn=None, ac=1, ar=sr, format='wav', threads=0)
             .overwrite_output()
             .run(quiet=True)
         )
@@ -148,42 +157,23 @@ def get_speaker_statistics(segments: List[Dict]) -> Dict:
     if not segments:
         return {"total_speakers": 0, "total_duration": 0.0, "speaker_durations": {}}
     
-    speaker_durations = {}
-    total_duration = 0.0
-    
-    for segment in segments:
-        speaker = segment["speaker"]
-        duration = segment["end"] - segment["start"]
-        speaker_durations[speaker] = speaker_durations.get(speaker, 0.0) + duration
-        total_duration += duration
+    # One vectorized pass: per-speaker totals via bincount over speaker codes
+    n = len(segments)
+    starts = np.fromiter((s["start"] for s in segments), dtype=np.float64, count=n)
+    ends = np.fromiter((s["end"] for s in segments), dtype=np.float64, count=n)
+    durations = ends - starts
+    # Hash-based codes (not np.unique): labels may mix None/str/int, which can't be sorted,
+    # and dict insertion order already keeps speakers in order of first appearance
+    speaker_codes = {}
+    codes = np.fromiter((speaker_codes.setdefault(s["speaker"], len(speaker_codes)) for s in segments), dtype=np.intp, count=n)
+    totals = np.bincount(codes, weights=durations, minlength=len(speaker_codes))
     
     return {
-        "total_speakers": len(speaker_durations),
-        "total_duration": round(total_duration, 2),
-        "speaker_durations": {k: round(v, 2) for k, v in speaker_durations.items()}
+        "total_speakers": len(speaker_codes),
+        "total_duration": round(float(durations.sum()), 2),
+        "speaker_durations": {speaker: round(float(totals[code]), 2) for speaker, code in speaker_codes.items()}
     }
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+# Opt-in warm load: pre-fork servers import this once, so workers inherit a loaded pipeline
+if os.getenv("SONORA_PRELOAD_PYANNOTE") == "1":
+    get_pipeline()
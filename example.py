@@ -7,8 +7,11 @@ This script demonstrates the complete real pipeline workflow using actual APIs:
 """
 
 import os
+import re
+import inspect
 import logging
 from pathlib import Path
+from typing import List
 
 from asr.transcriber import Transcriber
 from translate.translator import Translator
@@ -21,6 +24,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Segment languages that are sent to TTS
+_TTS_LANGS = frozenset(('EN', 'JP'))
+
 
 def dub_audio_file(input_audio_path: str, output_audio_path: str):
     """
@@ -63,8 +69,8 @@ def dub_audio_file(input_audio_path: str, output_audio_path: str):
         
         # Log each segment
         for i, segment in enumerate(segments):
-            logger.info(f"   Segment {i+1}: [{segment['start']:.2f}s-{segment['end']:.2f}s] "
-                       f"[{segment['lang']}] {segment['text']}")
+            logger.info("   Segment %d: [%.2fs-%.2fs] [%s] %s", i + 1,
+                        segment['start'], segment['end'], segment['lang'], segment['text'])
         logger.info("✅ ASR completed")
         logger.info("")
         
@@ -72,29 +78,26 @@ def dub_audio_file(input_audio_path: str, output_audio_path: str):
         logger.info("🌐 STAGE 2: TRANSLATION")
         logger.info("-" * 50)
         
-        translated_segments = []
-        japanese_segments = [seg for seg in segments if seg['lang'] == 'JP']
+        japanese_texts = [seg['text'] for seg in segments if seg['lang'] == 'JP']
         
-        if japanese_segments:
-            logger.info(f"🔄 Translating {len(japanese_segments)} Japanese segments with GPT-4o...")
-            
-            for i, segment in enumerate(japanese_segments):
-                logger.info(f"   Translating segment {i+1}: {segment['text']}")
-                translated_text = translator.translate(segment['text'], segment['lang'])
-                logger.info(f"   → {translated_text}")
-                
-                # Create translated segment
-                translated_segment = segment.copy()
-                translated_segment['text'] = translated_text
-                translated_segment['lang'] = 'EN'
-                translated_segments.append(translated_segment)
+        if japanese_texts:
+            logger.info(f"🔄 Translating {len(japanese_texts)} Japanese segments with GPT-4o...")
+            translations = translate_many(translator, japanese_texts, 'JP')
         else:
             logger.info("ℹ️  No Japanese segments found, skipping translation")
-            translated_segments = segments
+            translations = []
         
-        # Keep non-Japanese segments as-is
+        # Single pass in original order: Japanese segments swapped for their translation,
+        # everything else kept as-is
+        translations = iter(translations)
+        translated_segments = []
         for segment in segments:
-            if segment['lang'] != 'JP':
+            if segment['lang'] == 'JP':
+                translated_segment = segment.copy()
+                translated_segment['text'] = next(translations)
+                translated_segment['lang'] = 'EN'
+                translated_segments.append(translated_segment)
+            else:
                 translated_segments.append(segment)
         
         logger.info("✅ Translation completed")
@@ -105,9 +108,11 @@ def dub_audio_file(input_audio_path: str, output_audio_path: str):
         logger.info("-" * 50)
         
         # Combine all text for TTS
-        text_to_synthesize = " ".join([seg['text'] for seg in translated_segments if seg['lang'] in ['EN', 'JP']])
+        text_to_synthesize = " ".join(
+            seg['text'] for seg in translated_segments if seg['lang'] in _TTS_LANGS
+        ).strip()
         
-        if text_to_synthesize.strip():
+        if text_to_synthesize:
             logger.info(f"🎵 Synthesizing speech with ElevenLabs...")
             logger.info(f"📝 Text to synthesize: {text_to_synthesize}")
             
@@ -135,6 +140,75 @@ def dub_audio_file(input_audio_path: str, output_audio_path: str):
         return False
 
 
+_NUMBERED_LINE = re.compile(r'^\s*(\d+)[.)]\s*(.*)$')
+
+
+def _batch_method(translator):
+    """The translator's synchronous batch method, if it has one callable as method(texts, lang)."""
+    for name in ('translate_many', 'translate_batch'):
+        method = getattr(translator, name, None)
+        if not callable(method) or inspect.iscoroutinefunction(method):
+            continue
+        try:
+            inspect.signature(method).bind([], 'JP')
+        except (TypeError, ValueError):
+            continue
+        return method
+    return None
+
+
+def translate_many(translator, texts: List[str], lang: str) -> List[str]:
+    """
+    Translate several segments with as few API round-trips as possible.
+    
+    Uses the translator's own batch method when it has one; otherwise packs the
+    segments into one numbered prompt that asks for exactly one numbered line per
+    segment, and maps the reply back by index. Falls back to one call per segment
+    unless the reply has exactly lines 1..N.
+    
+    Args:
+        translator: Translator instance
+        texts: Segment texts, all in the same source language
+        lang: Source language code
+    
+    Returns:
+        Translations in the same order as texts
+    """
+    batch_method = _batch_method(translator)
+    if batch_method is not None:
+        translations = list(batch_method(texts, lang))
+        if len(translations) == len(texts):
+            return translations
+        logger.warning("⚠️  Batch translation returned %d results for %d segments", len(translations), len(texts))
+    
+    if len(texts) > 1:
+        # Numbered from 1: that's how models number lists back, even when asked otherwise
+        n = len(texts)
+        prompt = "\n".join(
+            [f"Translate each numbered line separately. Reply with exactly {n} lines, numbered 1 to {n}, "
+             "one translation per line, in the same order and with nothing else."]
+            + [f"{i}. {text}" for i, text in enumerate(texts, 1)]
+        )
+        reply = translator.translate(prompt, lang)
+        numbered = [_NUMBERED_LINE.match(line) for line in reply.splitlines()]
+        numbered = [(int(m.group(1)), m.group(2).strip()) for m in numbered if m]
+        parsed = dict(numbered)
+        # Exactly lines 1..n, each once; anything else (merged, split or repeated lines) is rejected
+        if len(numbered) == n and sorted(parsed) == list(range(1, n + 1)):
+            translations = [parsed[i] for i in range(1, n + 1)]
+            for i, translated_text in enumerate(translations, 1):
+                logger.info("   %d. → %s", i, translated_text)
+            return translations
+        logger.warning("⚠️  Batched translation reply was malformed, translating per segment")
+    
+    translations = []
+    for i, text in enumerate(texts):
+        logger.info("   Translating segment %d: %s", i + 1, text)
+        translations.append(translator.translate(text, lang))
+        logger.info("   → %s", translations[-1])
+    return translations
+
+
 def check_api_keys():
     """Check for required API keys and warn about missing ones."""
     logger.info("🔑 Checking API keys...")
@@ -4,17 +4,28 @@ import sys
 import time
 import subprocess
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+SWARM_SERVICES = [("Separator", 8000), ("Transcriber", 8001), ("Synthesizer", 8002)]
+
+# Keep-alive connections are reused when the audit is run repeatedly
+_http = requests.Session()
+
+def _probe(service):
+    name, port = service
+    try:
+        _http.get(f"http://localhost:{port}/health", timeout=1)
+        return name, True
+    except Exception:
+        return name, False
+
 def check_swarm_health():
     print("--- Sonora Swarm Health Audit ---")
-    services = [("Separator", 8000), ("Transcriber", 8001), ("Synthesizer", 8002)]
-    for name, port in services:
-        try:
-            res = requests.get(f"http://localhost:{port}/health", timeout=1)
-            print(f"[OK] {name} Node: ONLINE")
-        except:
-            print(f"[!!] {name} Node: OFFLINE")
+    # Probe all nodes at once: worst case is one timeout, not one per offline node
+    with ThreadPoolExecutor(max_workers=len(SWARM_SERVICES)) as ex:
+        for name, ok in ex.map(_probe, SWARM_SERVICES):
+            print(f"[{'OK' if ok else '!!'}] {name} Node: {'ONLINE' if ok else 'OFFLINE'}")
 
 def bootstrap():
     # Ensure Shared Volume
@@ -7,19 +7,36 @@ Refactored for 'Sync-Master' accuracy.
 import argparse
 import logging
 import os
+import subprocess
 import time
 from pathlib import Path
 
+import soundfile as sf
+
 from sonora.asr.transcriber import Transcriber
 from sonora.translate.translator import Translator
 from sonora.tts.tts_provider import TTSProvider
 from sonora.utils.muxer import AudioMuxer
-from sonora.core.audio_mixing import align_audio_to_duration
+from sonora.core.audio_mixing import align_audio_array
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger("sonora-pipeline")
 
+def probe_duration(path: Path) -> float:
+    """Media duration in seconds from the file header: libsndfile for WAV/FLAC/OGG, ffprobe for the rest."""
+    try:
+        info = sf.info(str(path))
+        return info.frames / info.samplerate
+    except Exception:
+        pass
+    # MP3/M4A/video containers: ffprobe parses the container without decoding it
+    result = subprocess.run([
+        'ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+        '-of', 'default=noprint_wrappers=1:nokey=1', str(path)
+    ], capture_output=True, text=True, check=True)
+    return float(result.stdout)
+
 def main():
     parser = argparse.ArgumentParser(description="Run the Sonora dubbing pipeline with Sync-Master alignment.")
     parser.add_argument("input", help="Path to input audio/video file")
@@ -51,9 +68,8 @@ def main():
         if transcription_result.get('timestamps') and len(transcription_result['timestamps']) > 0:
             duration_orig = transcription_result['timestamps'][-1]['end'] - transcription_result['timestamps'][0]['start']
         else:
-            # Fallback to total audio duration if timestamps missing
-            import librosa
-            duration_orig = librosa.get_duration(path=str(input_path))
+            # Fallback to total audio duration if timestamps missing (header read, no decode)
+            duration_orig = probe_duration(input_path)
 
         print(f"✅ Analysis complete. Detected length: {duration_orig:.2f}s")
 
@@ -67,15 +83,20 @@ def main():
         temp_tts_output = "temp_raw_tts.wav"
         tts.synthesize(translation, temp_tts_output)
         
-        # Apply Time-Stretching to lock sync
+        # Apply Time-Stretching to lock sync: the take is read once and stretched in memory
         print(f"⏳ [SYNC-MASTER] Aligning voice to target window ({duration_orig:.2f}s)...")
         aligned_voice_path = "aligned_voice_final.wav"
-        final_voice_path = align_audio_to_duration(
-            temp_tts_output, 
-            duration_orig, 
-            aligned_voice_path
-        )
-        print("✅ Temporal alignment successful.")
+        try:
+            y, sr = sf.read(temp_tts_output, dtype="float32")
+            if y.ndim > 1:
+                y = y.mean(axis=1)  # mono, as librosa.load delivered it
+            sf.write(aligned_voice_path, align_audio_array(y, sr, duration_orig), sr)
+            final_voice_path = aligned_voice_path
+            print("✅ Temporal alignment successful.")
+        except Exception as e:
+            # Same fallback as align_audio_to_duration: mix the unaligned take
+            logger.error(f"Critical failure during audio alignment: {e}")
+            final_voice_path = temp_tts_output
 
         # STAGE 4: MASTER MIXING
         print("\n🎵 [4/4] Finalizing Studio Master...")
@@ -1,7 +1,7 @@
 from fastapi import FastAPI, UploadFile, File
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 import uvicorn
-import time
+import asyncio
 import os
 import random
 
@@ -11,46 +11,59 @@ app = FastAPI(title="Sonora Mock Backend")
 async def health():
     return {"status": "ok", "service": "sonora-mock"}
 
+# Constant part of /api/metrics; only the counters are randomized per request
+_METRICS_BASE = {
+    "total_requests": 0,
+    "total_errors": 0,
+    "uptime_minutes": 120.5,
+    "system": {"cpu_percent": 12.5, "memory_mb": 512},
+    "latency": {"avg_latency_sec": 0.2},
+    "audio": {"audio_files_processed": 45},
+    "cache": {"cache_hit_rate_percent": 85.0}
+}
+
 @app.get("/api/metrics")
 async def metrics():
-    return {
-        "total_requests": random.randint(100, 500),
-        "total_errors": random.randint(0, 5),
-        "uptime_minutes": 120.5,
-        "system": {"cpu_percent": 12.5, "memory_mb": 512},
-        "latency": {"avg_latency_sec": 0.2},
-        "audio": {"audio_files_processed": 45},
-        "cache": {"cache_hit_rate_percent": 85.0}
-    }
+    m = _METRICS_BASE.copy()
+    m["total_requests"] = random.randint(100, 500)
+    m["total_errors"] = random.randint(0, 5)
+    return m
+
+# Static payloads, built once instead of per request
+_CACHE_STATS = {
+    "memory_items": 50,
+    "disk_items": 120,
+    "hit_rate": 0.85,
+    "cache_size_mb": 24.5,
+    "expired_entries": 10,
+    "total_requests": 200,
+    "uptime_minutes": 120.5
+}
+
+_ANALYTICS = {
+    "system": {"cpu_percent": 15},
+    "endpoints": {"/dub": {"requests": 50, "avg_latency": 1.2}}
+}
 
 @app.get("/api/cache/stats")
 async def cache_stats():
-    return {
-        "memory_items": 50,
-        "disk_items": 120,
-        "hit_rate": 0.85,
-        "cache_size_mb": 24.5,
-        "expired_entries": 10,
-        "total_requests": 200,
-        "uptime_minutes": 120.5
-    }
+    return _CACHE_STATS
 
 @app.get("/api/analytics")
 async def analytics():
-    return {
-        "system": {"cpu_percent": 15},
-        "endpoints": {"/dub": {"requests": 50, "avg_latency": 1.2}}
-    }
+    return _ANALYTICS
 
 @app.post("/api/dub")
 async def dub_audio(file: UploadFile = File(...)):
-    # Simulate processing delay
-    time.sleep(2)
+    # Simulate processing delay without blocking the event loop
+    await asyncio.sleep(2)
+    
+    # Return the same audio as "dubbed" (echo), streamed back in 64 KB chunks
+    async def iter_chunks():
+        while chunk := await file.read(65536):
+            yield chunk
     
-    # Return the same audio as "dubbed" (echo)
-    # We read into memory
-    content = await file.read()
-    return Response(content=content, media_type="audio/wav")
+    return StreamingResponse(iter_chunks(), media_type="audio/wav")
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -2,7 +2,7 @@
 Setup script for Sonora/Auralis AI Dubbing System.
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_namespace_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -17,7 +17,13 @@ setup(
     description="Anime-first AI dubbing system",
     long_description=long_description,
     long_description_content_type="text/markdown",
-    packages=find_packages(),
+    # sonora/core, sonora/utils, ... have no __init__.py, so discover namespace packages too
+    packages=find_namespace_packages(
+        include=["sonora", "sonora.*", "api", "api.*", "src", "src.*"],
+        exclude=["*.__pycache__", "sonora.data*"],
+    ),
+    # Top-level modules imported by sonora.core.orchestrator
+    py_modules=["transcriber", "diarize"],
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
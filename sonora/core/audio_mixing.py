@@ -6,6 +6,48 @@ import soundfile as sf
 
 logger = logging.getLogger(__name__)
 
+def align_audio_array(y: np.ndarray, sr: int, target_duration: float) -> np.ndarray:
+    """
+    In-memory core of align_audio_to_duration: time-stretch samples to fit target_duration.
+    
+    Args:
+        y: Mono samples.
+        sr: Sample rate of y.
+        target_duration: The duration (in seconds) the audio should fit into.
+        
+    Returns:
+        Samples of exactly int(target_duration * sr) length, at the same sample rate.
+    """
+    current_duration = len(y) / sr
+    if current_duration <= 0 or target_duration <= 0:
+        return y
+
+    # Calculate stretch rate: input_len / target_len
+    # rate > 1.0: speeds up (original is too long)
+    # rate < 1.0: slows down (original is too short)
+    stretch_rate = current_duration / target_duration
+    
+    # Apply "Studio Demo" Safety Thresholds
+    # Max speedup 1.3x, Max slowdown 0.8x
+    clamped_rate = max(0.8, min(1.3, stretch_rate))
+    
+    if stretch_rate != clamped_rate:
+        logger.warning(f"Stretch rate {stretch_rate:.2f} exceeds bounds. Clamping to {clamped_rate:.2f} to preserve quality.")
+
+    # Perform high-quality time stretching
+    y_stretched = librosa.effects.time_stretch(y, rate=clamped_rate)
+    
+    # Hard alignment: Force exact sample count match to avoid drift
+    target_samples = int(target_duration * sr)
+    if len(y_stretched) > target_samples:
+        y_stretched = y_stretched[:target_samples]
+    elif len(y_stretched) < target_samples:
+        y_stretched = np.pad(y_stretched, (0, target_samples - len(y_stretched)))
+
+    logger.info(f"Audio aligned: {current_duration:.2f}s -> {target_duration:.2f}s (Rate: {clamped_rate:.2f})")
+    return y_stretched
+
+
 def align_audio_to_duration(audio_path: str, target_duration: float, output_path: str) -> str:
     """
     Time-stretches audio to match a target duration precisely.
@@ -30,31 +72,10 @@ def align_audio_to_duration(audio_path: str, target_duration: float, output_path
         if current_duration <= 0 or target_duration <= 0:
             return audio_path
 
-        # Calculate stretch rate: input_len / target_len
-        # rate > 1.0: speeds up (original is too long)
-        # rate < 1.0: slows down (original is too short)
-        stretch_rate = current_duration / target_duration
-        
-        # Apply "Studio Demo" Safety Thresholds
-        # Max speedup 1.3x, Max slowdown 0.8x
-        clamped_rate = max(0.8, min(1.3, stretch_rate))
-        
-        if stretch_rate != clamped_rate:
-            logger.warning(f"Stretch rate {stretch_rate:.2f} exceeds bounds. Clamping to {clamped_rate:.2f} to preserve quality.")
-
-        # Perform high-quality time stretching
-        y_stretched = librosa.effects.time_stretch(y, rate=clamped_rate)
-        
-        # Hard alignment: Force exact sample count match to avoid drift
-        target_samples = int(target_duration * sr)
-        if len(y_stretched) > target_samples:
-            y_stretched = y_stretched[:target_samples]
-        elif len(y_stretched) < target_samples:
-            y_stretched = np.pad(y_stretched, (0, target_samples - len(y_stretched)))
+        y_stretched = align_audio_array(y, sr, target_duration)
 
         # Save to disk
         sf.write(output_path, y_stretched, sr)
-        logger.info(f"Audio aligned: {current_duration:.2f}s -> {target_duration:.2f}s (Rate: {clamped_rate:.2f})")
         return output_path
         
     except Exception as e:
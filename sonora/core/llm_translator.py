@@ -319,6 +319,21 @@ class HardenedTranslator:
             logger.error(f"Cloud translation completely failed: {e}")
             return {"text": "[ERROR: API FAULT]", "provider": "error"}
 
+    def warmup(self, prompt: str = "こんにちは") -> None:
+        """
+        Run one throwaway inference on the local model so the first real request
+        doesn't pay weight paging / kernel setup. Cloud providers are skipped (no cold
+        start worth paying quota for).
+        """
+        local = self.translators.get("local_qwen")
+        if local is None:
+            return
+        try:
+            local.translate(prompt)
+            logger.info("Local Qwen translator warmed up")
+        except Exception as e:
+            logger.warning(f"Local translator warm-up failed: {e}")
+
     def translate_batch(self, prompts: List[str]) -> List[Union[str, Dict[str, str]]]:
         if self.mock_mode:
             return [{"text": f"[MOCK BATCH] {p[:20]}", "provider": "mock"} for p in prompts]
@@ -4,19 +4,22 @@ import logging
 import subprocess
 import time
 import asyncio
+import copy
 import gc
+import importlib.util
 try:
     import torch
     HAS_TORCH = True
 except ImportError:
     HAS_TORCH = False
+import numpy as np
 import soundfile as sf
-from typing import List, Dict, Any, Optional, Union, Callable
+from typing import List, Dict, Any, Optional, Union, Callable, Awaitable
 from sonora.audio_editing.path_manager import get_data_dir, get_secure_path
 from sonora.core.reliability import HardwareLock
 
 import re
-import requests
+import httpx
 from dotenv import load_dotenv
 
 # Ensure environment is loaded
@@ -28,6 +31,34 @@ from diarize import diarize_video
 
 logger = logging.getLogger("sonora.orchestrator")
 
+# Max translation batches in flight at once (each batch is one provider call)
+TRANSLATE_CONCURRENCY = int(os.getenv("SONORA_TRANSLATE_CONCURRENCY", "4"))
+# Providers whose batches must run one at a time: Gemini paces its free tier with per-call
+# sleeps inside translate_batch, and local Qwen is a single HF model that isn't re-entrant
+SERIAL_TRANSLATE_PROVIDERS = frozenset({"gemini", "local_qwen"})
+# Max TTS lines in flight at once across ElevenLabs / the local synthesizer
+SYNTH_CONCURRENCY = int(os.getenv("SONORA_SYNTH_CONCURRENCY", "6"))
+
+# Shared keep-alive pool for outbound service calls (TTS, segmenter); closed by the API on shutdown
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Returns the process-wide pooled client, reusing TCP/TLS connections across requests."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=60.0,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    return _HTTP_CLIENT
+
+async def close_http_client():
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
 def group_words_by_pause(words: List[Dict], pause_threshold: float = 0.25, max_words: int = 8, max_duration: float = 3.0) -> List[List[Dict]]:
     """Groups words into segments based on time gaps, speaker changes, punctuation, and length constraints with Surgical Sentence Splitting."""
     if not words: 
@@ -35,38 +66,38 @@ def group_words_by_pause(words: List[Dict], pause_threshold: float = 0.25, max_w
         return []
     
     # 1. Alphanumeric Filter: Whisper sometimes returns isolated dots or non-verbal sounds.
-    vocal_words = []
-    for w in words:
-        text = str(w.get('word', '')).strip()
-        if any(c.isalnum() for c in text):
-            vocal_words.append(w)
-            
+    vocal_words = [w for w in words if any(c.isalnum() for c in str(w.get('word', '')).strip())]
     if not vocal_words:
         return []
 
-    segments = []
-    current_segment = [vocal_words[0]]
+    n = len(vocal_words)
+    starts = np.fromiter((w.get('start', 0) for w in vocal_words), dtype=np.float64, count=n)
+    ends = np.fromiter((w.get('end', 0) for w in vocal_words), dtype=np.float64, count=n)
+    speakers = [w.get('speaker') for w in vocal_words]
     # Split on any sentence-ending punctuation AND hard word/duration walls
     split_punctuation = re.compile(r'.*[\.\?\!\…]{1,}')
-    
-    for i in range(1, len(vocal_words)):
-        seg_duration = vocal_words[i-1].get('end', 0) - current_segment[0].get('start', 0)
-        gap = vocal_words[i].get('start', 0) - vocal_words[i-1].get('end', 0)
-        speaker_changed = vocal_words[i].get('speaker') != vocal_words[i-1].get('speaker')
-        
-        last_word_text = str(vocal_words[i-1].get('word', '')).strip()
-        has_punctuation = bool(split_punctuation.match(last_word_text))
-        
-        # Split conditions:
-        if gap > pause_threshold or speaker_changed or has_punctuation or len(current_segment) >= max_words or seg_duration >= max_duration:
-            # 2. Force Split: Always append what we have. No 0.4s guard here (it causes data loss).
-            segments.append(current_segment)
-            current_segment = []
-            
-        current_segment.append(vocal_words[i])
-        
-    if current_segment:
-        segments.append(current_segment)
+    has_punctuation = np.fromiter(
+        (bool(split_punctuation.match(str(w.get('word', '')).strip())) for w in vocal_words), dtype=bool, count=n
+    )
+
+    # 2. Gap / speaker / punctuation walls are independent of segment state: one vectorized pass.
+    # opens[i] means word i starts a new segment.
+    opens = np.zeros(n, dtype=bool)
+    opens[1:] = (starts[1:] - ends[:-1]) > pause_threshold
+    opens[1:] |= np.fromiter((speakers[i] != speakers[i - 1] for i in range(1, n)), dtype=bool, count=n - 1)
+    opens[1:] |= has_punctuation[:-1]
+    bounds = [0, *np.flatnonzero(opens).tolist(), n]
+
+    # 3. Word/duration walls depend on where the current segment began, so walk each run by index.
+    # Force Split: Always append what we have. No 0.4s guard here (it causes data loss).
+    segments = []
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        seg_start = lo
+        for i in range(lo + 1, hi):
+            if i - seg_start >= max_words or ends[i - 1] - starts[seg_start] >= max_duration:
+                segments.append(vocal_words[seg_start:i])
+                seg_start = i
+        segments.append(vocal_words[seg_start:hi])
             
     return segments
 
@@ -105,6 +136,15 @@ def interpolate_words_from_text(text: str, start: float, end: float, speaker: st
     
     return words
 
+def segment_text(segment: List[Dict]) -> str:
+    """Joins a word-level segment back into its source line."""
+    return " ".join(w.get('word', '') for w in segment)
+
+def _interpolate_segment_words(seg: Dict) -> List[Dict]:
+    """Fallback: If Whisper/Gemini returned a segment without word-level timestamps, interpolate them."""
+    logger.warning(f"🎙️ Orchestrator: Word-level timestamps missing for segment. Interpolating.")
+    return interpolate_words_from_text(seg.get("text", ""), seg.get("start", 0), seg.get("end", 0))
+
 def count_syllables(text: str) -> int:
     """Estimates English syllables simplified for dubbing sync."""
     text = text.lower()
@@ -133,8 +173,11 @@ class SonoraOrchestrator:
     """
     Main Orchestrator for the Sonora Swarm.
     Routes requests to local microservices or cloud fallbacks.
+
+    Engines are loaded once in __init__; use bind() to get a per-job view
+    instead of constructing a new orchestrator for every request.
     """
-    def __init__(self, audio_path: str, status_callback: Optional[Callable[[str], None]] = None):
+    def __init__(self, audio_path: Optional[str] = None, status_callback: Optional[Callable[[str], None]] = None):
         self.audio_path = audio_path
         self.status_callback = status_callback
         self.transcriber = Transcriber()
@@ -171,6 +214,14 @@ class SonoraOrchestrator:
         logger.info(f"🌊 Orchestrator: Initializing Separator with {model_selection.value} (Cloud: {cloud_offload})")
         self.separator = AudioSeparator(model=model_selection)
 
+    def bind(self, audio_path: Optional[str], status_callback: Optional[Callable[[str], None]] = None) -> "SonoraOrchestrator":
+        """Returns a shallow per-job copy that shares the loaded engines but owns its file path."""
+        bound = copy.copy(self)
+        bound.audio_path = audio_path
+        if status_callback is not None:
+            bound.status_callback = status_callback
+        return bound
+
     def update_status(self, msg: str):
         if self.status_callback:
             if asyncio.iscoroutinefunction(self.status_callback):
@@ -189,14 +240,7 @@ class SonoraOrchestrator:
         diarize_task = asyncio.to_thread(diarize_video, target_path)
         
         asr_result, speaker_segments = await asyncio.gather(asr_task, diarize_task)
-        words = []
-        for seg in asr_result.get("segments", []):
-            seg_words = seg.get("words", [])
-            # Fallback: If Whisper/Gemini returned a segment without word-level timestamps, interpolate them
-            if not seg_words:
-                logger.warning(f"🎙️ Orchestrator: Word-level timestamps missing for segment. Interpolating.")
-                seg_words = interpolate_words_from_text(seg.get("text", ""), seg.get("start", 0), seg.get("end", 0))
-            words.extend(seg_words)
+        words = [w for seg in asr_result.get("segments", []) for w in (seg.get("words") or _interpolate_segment_words(seg))]
             
         # 2. Attach speakers to words using maximum overlap
         for word in words:
@@ -305,7 +349,7 @@ class SonoraOrchestrator:
     async def translate_segment(self, segment: Union[List[Dict], Dict], style: str = "Anime") -> Dict[str, str]:
         """Translates a segment using the Hardened Translator and returns text + provider."""
         if isinstance(segment, list):
-            text = " ".join([w.get('word', w.get('text', '')) for w in segment])
+            text = " ".join(w.get('word', w.get('text', '')) for w in segment)
         else:
             text = segment.get('text', '')
             
@@ -329,58 +373,85 @@ class SonoraOrchestrator:
             f"English Translation:"
         )
 
-    async def translate_segments_batch(self, segments_raw: List[List[Dict]], style: str = "Anime") -> List[str]:
-        """Translates a list of segments in batches for high-speed analysis."""
-        all_translations = []
+    async def translate_segments_batch(self, segments_raw: List[List[Dict]], style: str = "Anime", texts: Optional[List[str]] = None,
+                                       on_batch: Optional[Callable[[int, List[str]], Awaitable[None]]] = None) -> List[str]:
+        """Translates a list of segments in batches for high-speed analysis.
+
+        Pass texts (one segment_text() per segment) when the caller already joined them.
+        on_batch(offset, translations) is awaited as each batch completes (possibly out of order).
+        """
+        if texts is None:
+            texts = [segment_text(seg) for seg in segments_raw]
         batch_size = 50 # Increased for Parallel Bursting
-        
-        i = 0
-        while i < len(segments_raw):
-            batch_segments = segments_raw[i : i + batch_size]
-            batch_num = (i // batch_size) + 1
-            total_batches = (len(segments_raw) + batch_size - 1) // batch_size
-            
-            self.update_status(f"🌐 Swarm: Translating Batch {batch_num}/{total_batches}...")
-            
-            batch_prompts = []
-            for seg in batch_segments:
-                original_text = " ".join([w.get('word', '') for w in seg])
-                # Skip noise/punctuation-only segments to save API credits and speed up analysis
-                if not any(c.isalnum() for c in original_text):
-                    batch_prompts.append(None) # Marker to skip
-                    continue
-                    
-                syllables = estimate_japanese_morae(original_text)
-                prompt = self._build_translate_prompt(original_text, syllables, style)
-                batch_prompts.append(prompt)
-            
-            logger.info(f"🧠 [BATCH] Translating {len([p for p in batch_prompts if p])} valid segments...")
-            
-            # Filter None prompts for the actual API call
-            valid_prompts = [p for p in batch_prompts if p]
-            if valid_prompts:
-                batch_results_raw = await asyncio.to_thread(self.translator.translate_batch, valid_prompts)
-            else:
-                batch_results_raw = []
-                
-            # Re-map results including skipped markers
-            res_idx = 0
-            for prompt in batch_prompts:
-                if prompt is None:
-                    # Return a special ignore sentinel that our hygiene logic already understands
-                    all_translations.append("[EXTRANEOUS]")
+        total_batches = (len(segments_raw) + batch_size - 1) // batch_size
+        # Batches are independent: overlap their provider round-trips for burst-capable providers.
+        # Self-pacing/single-model providers and conservative (post-429) mode go one batch at a time;
+        # that is re-checked per batch, since a rate limit can flip the mode mid-run.
+        sem = asyncio.Semaphore(TRANSLATE_CONCURRENCY)
+        serial = asyncio.Lock()
+        completed = 0
+
+        async def _run(offset: int) -> List[str]:
+            nonlocal completed
+            async with sem:
+                if self._translate_serially():
+                    async with serial:
+                        translations = await self._translate_batch(texts[offset : offset + batch_size], style)
                 else:
-                    res = batch_results_raw[res_idx]
-                    if isinstance(res, dict):
-                        all_translations.append(res.get("text", "[ERROR]"))
-                    else:
-                        all_translations.append(res)
-                    res_idx += 1
+                    translations = await self._translate_batch(texts[offset : offset + batch_size], style)
+            completed += 1
+            self.update_status(f"🌐 Swarm: Translated Batch {completed}/{total_batches}...")
+            if on_batch is not None:
+                await on_batch(offset, translations)
+            return translations
+
+        batches = await asyncio.gather(*[_run(i) for i in range(0, len(texts), batch_size)])
+        # Removed 5s Burst-Gap: Throttling is now Provider-Aware in llm_translator.py
+        return [t for batch in batches for t in batch]
+
+    def _translate_serially(self) -> bool:
+        """True when translation batches must not overlap (provider pacing or a single local model)."""
+        translator = self.translator
+        if getattr(translator, "mock_mode", False):
+            return False
+        return (getattr(translator, "concurrency_mode", "burst") == "conservative"
+                or getattr(translator, "provider", None) in SERIAL_TRANSLATE_PROVIDERS)
+
+    async def _translate_batch(self, batch_texts: List[str], style: str) -> List[str]:
+        """Translates one batch, keeping skipped noise segments aligned as [EXTRANEOUS]."""
+        batch_prompts = []
+        for original_text in batch_texts:
+            # Skip noise/punctuation-only segments to save API credits and speed up analysis
+            if not any(c.isalnum() for c in original_text):
+                batch_prompts.append(None) # Marker to skip
+                continue
                 
-            i += batch_size
-            # Removed 5s Burst-Gap: Throttling is now Provider-Aware in llm_translator.py
+            syllables = estimate_japanese_morae(original_text)
+            batch_prompts.append(self._build_translate_prompt(original_text, syllables, style))
+        
+        # Filter None prompts for the actual API call
+        valid_prompts = [p for p in batch_prompts if p]
+        logger.info(f"🧠 [BATCH] Translating {len(valid_prompts)} valid segments...")
+        if valid_prompts:
+            batch_results_raw = await asyncio.to_thread(self.translator.translate_batch, valid_prompts)
+        else:
+            batch_results_raw = []
             
-        return all_translations
+        # Re-map results including skipped markers
+        translations = []
+        res_idx = 0
+        for prompt in batch_prompts:
+            if prompt is None:
+                # Return a special ignore sentinel that our hygiene logic already understands
+                translations.append("[EXTRANEOUS]")
+            else:
+                res = batch_results_raw[res_idx]
+                if isinstance(res, dict):
+                    translations.append(res.get("text", "[ERROR]"))
+                else:
+                    translations.append(res)
+                res_idx += 1
+        return translations
 
     async def refactor_line(self, text: str, target_syllables: int, style: str) -> Dict[str, str]:
         """Refines a line to match target syllable count and returns text + provider."""
@@ -388,7 +459,7 @@ class SonoraOrchestrator:
         prompt = self._build_translate_prompt(text, target_syllables, style)
         return self.translator.translate(prompt)
 
-    async def _synthesize_single_segment(self, i: int, text: str, original_text: str, emotion: str, voice_id: str, SYNTH_URL: str, is_main: bool = True) -> str:
+    async def _synthesize_single_segment(self, i: int, text: str, original_text: str, emotion: str, voice_id: str, SYNTH_URL: str, is_main: bool = True, *, client: httpx.AsyncClient) -> str:
         """Helper for parallel synthesis of a single line."""
         # Use a sanitized take name to avoid collisions
         take_name = f"take_{int(time.time())}_{i}.wav"
@@ -411,7 +482,7 @@ class SonoraOrchestrator:
                 from src.core.shadow_providers import cloud_generate_voice
                 el_voice = os.getenv("ELEVENLABS_VOICE_ID", "JBFqnCBcs6BaNtIGwHQK") 
                 audio_bytes = await asyncio.to_thread(cloud_generate_voice, text, el_voice)
-                with open(take_path, "wb") as f: f.write(audio_bytes)
+                await asyncio.to_thread(take_path.write_bytes, audio_bytes)
                 success = True
             except Exception as e:
                 logger.warning(f"ElevenLabs failed for segment {i}: {e}. Falling back...")
@@ -426,9 +497,15 @@ class SonoraOrchestrator:
                     "target_syllables": target_sylls,
                     "is_main_character": is_main
                 }
-                r = await asyncio.to_thread(requests.post, SYNTH_URL, json=payload, timeout=60)
-                r.raise_for_status()
-                with open(take_path, "wb") as f: f.write(r.content)
+                # Stream the WAV straight to the take file as it arrives; disk writes run off the event loop
+                async with client.stream("POST", SYNTH_URL, json=payload) as r:
+                    r.raise_for_status()
+                    f = await asyncio.to_thread(open, take_path, "wb")
+                    try:
+                        async for chunk in r.aiter_bytes():
+                            await asyncio.to_thread(f.write, chunk)
+                    finally:
+                        await asyncio.to_thread(f.close)
                 success = True
             except Exception as e:
                 logger.warning(f"Local synthesis failed for segment {i}: {e}. Falling back...")
@@ -456,6 +533,14 @@ class SonoraOrchestrator:
         main_threshold = 5
         main_speakers = {spk for spk, count in speaker_counts.items() if count >= main_threshold}
         
+        # Bounded fan-out over one keep-alive client: wall-clock tends to max(RTT) instead of N x handshake
+        sem = asyncio.Semaphore(SYNTH_CONCURRENCY)
+
+        async def _bounded(*args, **kwargs) -> str:
+            async with sem:
+                return await self._synthesize_single_segment(*args, **kwargs)
+
+        client = get_http_client()
         tasks = []
         for i, text in enumerate(translations):
             original_text = segments[i].get('original', '')
@@ -463,8 +548,8 @@ class SonoraOrchestrator:
             emotion = segments[i].get('emotion', 'Neutral')
             is_main = speaker in main_speakers
             
-            tasks.append(self._synthesize_single_segment(
-                i, text, original_text, emotion, voice_id, SYNTH_URL, is_main=is_main
+            tasks.append(_bounded(
+                i, text, original_text, emotion, voice_id, SYNTH_URL, is_main=is_main, client=client
             ))
         
         audio_takes = await asyncio.gather(*tasks)
@@ -9,6 +9,9 @@ from transformers import AutoModelForCausalLM, AutoTokenizer
 
 logger = logging.getLogger("sonora.synthesizer.qwen3")
 
+# GPU weight/activation dtype (SONORA_TTS_DTYPE); CPU always runs fp32
+TTS_DTYPES = {"fp16": torch.float16, "bf16": torch.bfloat16, "fp32": torch.float32}
+
 class Qwen3Engine:
     """
     Stability Layer: Qwen3-TTS (1.7B/0.6B) for Background Characters & Crowds.
@@ -23,11 +26,12 @@ class Qwen3Engine:
         
         if os.path.exists(model_path):
             try:
-                logger.info(f"🚀 Loading Qwen3-TTS on {self.device}...")
+                dtype = TTS_DTYPES.get(os.getenv("SONORA_TTS_DTYPE", "fp16"), torch.float16) if self.device == "cuda" else torch.float32
+                logger.info(f"🚀 Loading Qwen3-TTS on {self.device} ({dtype})...")
                 self.tokenizer = AutoTokenizer.from_pretrained(model_path)
                 self.model = AutoModelForCausalLM.from_pretrained(
                     model_path, 
-                    torch_dtype=torch.float16 if self.device == "cuda" else torch.float32
+                    torch_dtype=dtype
                 ).to(self.device)
                 self.is_ready = True
                 logger.info("✅ Qwen3-TTS Loaded Successfully.")
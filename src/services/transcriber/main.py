@@ -17,6 +17,8 @@ app = FastAPI(title="Sonora Transcriber")
 SHARED_PATH = os.getenv("SHARED_PATH", "/tmp/sonora")
 MODEL_SIZE = os.getenv("WHISPER_MODEL", "large-v3")
 MODEL_PATH = "models/whisper"
+# CTranslate2 compute type; unset picks int8 on CPU and int8_float16 on CUDA
+WHISPER_COMPUTE = os.getenv("SONORA_WHISPER_COMPUTE")
 
 # Lazy load model to prevent OOM on startup
 _model = None
@@ -25,11 +27,12 @@ def load_model():
     global _model
     if _model is None:
         device = get_device()
-        logger.info(f"🚀 Loading Whisper {MODEL_SIZE} on {device}...")
+        compute_type = WHISPER_COMPUTE or ("int8_float16" if device == "cuda" else "int8")
+        logger.info(f"🚀 Loading Whisper {MODEL_SIZE} on {device} ({compute_type})...")
         _model = WhisperModel(
             MODEL_SIZE, 
             device=device, 
-            compute_type="float16" if device == "cuda" else "int8",
+            compute_type=compute_type,
             download_root=MODEL_PATH
         )
     return _model
@@ -6,9 +6,13 @@ from transformers import AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig
 
 logger = logging.getLogger("sonora.translator.qwen_local")
 
+# GPU weight-only quantization (SONORA_LLM_QUANT): int4 (NF4) | int8 | fp16.
+# Activations stay fp16 in every mode; W8A8 does not speed up autoregressive decoding.
+LLM_QUANT = os.getenv("SONORA_LLM_QUANT", "int4").lower()
+
 class LocalQwenTranslator:
     """
-    Local implementation of Qwen2.5-7B-Instruct using 4-bit quantization.
+    Local implementation of Qwen2.5-7B-Instruct using weight-only quantization (4-bit by default).
     Handles high-quality, syllable-aware translation.
     """
     def __init__(self, model_path: str = "models/qwen7b"):
@@ -20,18 +24,20 @@ class LocalQwenTranslator:
         
         if os.path.exists(model_path):
             try:
-                logger.info(f"🚀 Loading Qwen2.5-7B (INT4) on {self.device}...")
+                logger.info(f"🚀 Loading Qwen2.5-7B ({LLM_QUANT.upper()}) on {self.device}...")
                 self.tokenizer = AutoTokenizer.from_pretrained(model_path)
                 
-                # Configure 4-bit quantization for VRAM efficiency
+                # Configure weight-only quantization for VRAM efficiency
                 bnb_config = None
-                if self.device == "cuda":
+                if self.device == "cuda" and LLM_QUANT == "int4":
                     bnb_config = BitsAndBytesConfig(
                         load_in_4bit=True,
                         bnb_4bit_use_double_quant=True,
                         bnb_4bit_quant_type="nf4",
                         bnb_4bit_compute_dtype=torch.float16
                     )
+                elif self.device == "cuda" and LLM_QUANT == "int8":
+                    bnb_config = BitsAndBytesConfig(load_in_8bit=True)
                 
                 self.model = AutoModelForCausalLM.from_pretrained(
                     model_path,
@@ -44,7 +50,7 @@ class LocalQwenTranslator:
                     self.model = self.model.to("cpu")
                     
                 self.is_ready = True
-                logger.info("✅ Qwen2.5-7B INT4 Loaded Successfully.")
+                logger.info(f"✅ Qwen2.5-7B {LLM_QUANT.upper()} Loaded Successfully.")
             except Exception as e:
                 logger.error(f"❌ Failed to load Qwen 7B: {e}")
         else:
@@ -0,0 +1,46 @@
+import unittest
+
+from fastapi.testclient import TestClient
+
+import api.server as server
+from api.auth import API_KEY_NAME, _EXPECTED_KEY
+
+# Body returned by the former SonoraAuthMiddleware; the dependency keeps it
+BLOCKED_BODY = {
+    "detail": "Sonora Security Block: Invalid or Missing API Key",
+    "required_header": API_KEY_NAME,
+    "debug_hint": "Check SONORA_API_KEY in .env and Ensure UI/API are synced."
+}
+
+
+class TestRequireApiKey(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(server.app)
+
+    def assertBlocked(self, response):
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json(), BLOCKED_BODY)
+        self.assertEqual(response.headers.get("X-Required-Header"), API_KEY_NAME)
+
+    def test_missing_key_is_blocked(self):
+        self.assertBlocked(self.client.get("/api/job/unknown"))
+
+    def test_wrong_key_is_blocked(self):
+        self.assertBlocked(self.client.get("/api/job/unknown", headers={API_KEY_NAME: _EXPECTED_KEY + "x"}))
+
+    def test_empty_and_non_ascii_keys_are_blocked(self):
+        self.assertBlocked(self.client.get("/api/job/unknown", headers={API_KEY_NAME: "   "}))
+        self.assertBlocked(self.client.get("/api/job/unknown", headers={API_KEY_NAME: "ключ".encode("utf-8")}))
+
+    def test_valid_key_reaches_the_route(self):
+        # Surrounding whitespace is tolerated, as before the dependency rewrite
+        response = self.client.get("/api/job/unknown", headers={API_KEY_NAME: f" {_EXPECTED_KEY} "})
+        self.assertEqual(response.status_code, 404)
+
+    def test_health_is_open(self):
+        response = self.client.get("/health")
+        self.assertEqual(response.status_code, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import ast
+import random
+import re
+import unittest
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / "create_voice_metadata_simple.py"
+
+
+def load_emotion_helpers():
+    """Compile just EMOTION_CODES, EMO_RE and detect_emotion: importing the script runs the whole scan."""
+    tree = ast.parse(SCRIPT.read_text(encoding="utf-8"))
+    wanted = {"EMOTION_CODES", "EMO_RE", "detect_emotion"}
+    body = [
+        node for node in tree.body
+        if (isinstance(node, ast.FunctionDef) and node.name in wanted)
+        or (isinstance(node, ast.Assign) and any(getattr(t, "id", None) in wanted for t in node.targets))
+    ]
+    namespace = {"re": re}
+    exec(compile(ast.Module(body=body, type_ignores=[]), str(SCRIPT), "exec"), namespace)
+    return namespace["detect_emotion"]
+
+
+detect_emotion = load_emotion_helpers()
+
+
+def reference_detect_emotion(name):
+    """The original keyword loop, kept as the behavioral reference."""
+    for emo in ["ANG", "DIS", "FEA", "HAP", "NEU", "SAD", "SUR", "calm", "happy", "sad", "angry", "fear", "disgust", "neutral"]:
+        if emo.lower() in name.lower():
+            return emo.upper()
+    return ""
+
+
+class TestDetectEmotion(unittest.TestCase):
+    def assertMatchesReference(self, name):
+        self.assertEqual(detect_emotion(name), reference_detect_emotion(name), name)
+
+    def test_crema_d_and_ravdess_style_names(self):
+        self.assertEqual(detect_emotion("1001_DFA_ANG_XX.wav"), "ANG")
+        self.assertEqual(detect_emotion("1001_IEO_HAP_HI.wav"), "HAP")
+        self.assertEqual(detect_emotion("03-01-02-01-01-01-01_calm.wav"), "CALM")
+        self.assertEqual(detect_emotion("speaker_001.wav"), "")
+
+    def test_long_forms_map_to_their_code(self):
+        for name, code in [("happy_01", "HAP"), ("Angry", "ANG"), ("fear", "FEA"), ("disgust", "DIS"),
+                           ("neutral", "NEU"), ("sad", "SAD"), ("surprised", "SUR")]:
+            self.assertEqual(detect_emotion(name), code)
+            self.assertMatchesReference(name)
+
+    def test_priority_order_not_position_wins(self):
+        # SAD appears first in the name, but ANG comes first in the keyword list
+        self.assertEqual(detect_emotion("sad_then_angry"), "ANG")
+        self.assertEqual(detect_emotion("neutral_disgust"), "DIS")
+        self.assertEqual(detect_emotion("calm_sur"), "SUR")
+        for name in ("sad_then_angry", "neutral_disgust", "calm_sur", "xhapxfeax"):
+            self.assertMatchesReference(name)
+
+    def test_matching_is_case_insensitive_and_spans_newlines(self):
+        for name in ("hApPy", "FEAR", "x\nneu", "CaLm\n"):
+            self.assertMatchesReference(name)
+
+    def test_randomized_against_reference(self):
+        rng = random.Random(42)
+        pieces = ["ang", "DIS", "fea", "Hap", "neu", "SAD", "sur", "calm", "cal", "an", "_", "-", "x", "01", "\n", "happy"]
+        for _ in range(2000):
+            self.assertMatchesReference("".join(rng.choice(pieces) for _ in range(rng.randint(0, 8))))
+
+
+if __name__ == "__main__":
+    unittest.main()
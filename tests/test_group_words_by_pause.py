@@ -0,0 +1,117 @@
+import random
+import re
+import unittest
+
+from sonora.core.orchestrator import group_words_by_pause
+
+
+def reference_group_words_by_pause(words, pause_threshold=0.25, max_words=8, max_duration=3.0):
+    """The original per-word loop, kept verbatim as the behavioral reference."""
+    vocal_words = [w for w in words if any(c.isalnum() for c in str(w.get('word', '')).strip())]
+    if not vocal_words:
+        return []
+
+    segments = []
+    current_segment = [vocal_words[0]]
+    split_punctuation = re.compile(r'.*[\.\?\!\…]{1,}')
+
+    for i in range(1, len(vocal_words)):
+        seg_duration = vocal_words[i-1].get('end', 0) - current_segment[0].get('start', 0)
+        gap = vocal_words[i].get('start', 0) - vocal_words[i-1].get('end', 0)
+        speaker_changed = vocal_words[i].get('speaker') != vocal_words[i-1].get('speaker')
+
+        last_word_text = str(vocal_words[i-1].get('word', '')).strip()
+        has_punctuation = bool(split_punctuation.match(last_word_text))
+
+        if gap > pause_threshold or speaker_changed or has_punctuation or len(current_segment) >= max_words or seg_duration >= max_duration:
+            segments.append(current_segment)
+            current_segment = []
+
+        current_segment.append(vocal_words[i])
+
+    if current_segment:
+        segments.append(current_segment)
+
+    return segments
+
+
+def make_words(spec):
+    """spec: list of (word, start, end, speaker)."""
+    return [{"word": w, "start": s, "end": e, "speaker": spk} for w, s, e, spk in spec]
+
+
+def texts(segments):
+    return [[w["word"] for w in seg] for seg in segments]
+
+
+class TestGroupWordsByPause(unittest.TestCase):
+    def assertMatchesReference(self, words, **kwargs):
+        expected = reference_group_words_by_pause(words, **kwargs)
+        actual = group_words_by_pause(words, **kwargs)
+        self.assertEqual(texts(actual), texts(expected))
+        return actual
+
+    def test_empty_and_non_vocal(self):
+        self.assertEqual(group_words_by_pause([]), [])
+        self.assertEqual(group_words_by_pause(make_words([(".", 0, 0.1, "A"), ("…", 0.1, 0.2, "A")])), [])
+
+    def test_gap_split(self):
+        words = make_words([("a", 0.0, 0.2, "A"), ("b", 0.3, 0.5, "A"), ("c", 1.0, 1.2, "A")])
+        segments = self.assertMatchesReference(words)
+        self.assertEqual(texts(segments), [["a", "b"], ["c"]])
+
+    def test_speaker_change_split(self):
+        words = make_words([("a", 0.0, 0.2, "A"), ("b", 0.2, 0.4, "B"), ("c", 0.4, 0.6, "B")])
+        segments = self.assertMatchesReference(words)
+        self.assertEqual(texts(segments), [["a"], ["b", "c"]])
+
+    def test_missing_speaker_labels(self):
+        words = [{"word": "a", "start": 0.0, "end": 0.2}, {"word": "b", "start": 0.2, "end": 0.4, "speaker": None},
+                 {"word": "c", "start": 0.4, "end": 0.6, "speaker": "A"}]
+        self.assertMatchesReference(words)
+
+    def test_punctuation_split(self):
+        words = make_words([("Hi.", 0.0, 0.2, "A"), ("there", 0.2, 0.4, "A"), ("now?!", 0.4, 0.6, "A"),
+                            ("ok…", 0.6, 0.8, "A"), ("go", 0.8, 1.0, "A")])
+        segments = self.assertMatchesReference(words)
+        self.assertEqual(texts(segments), [["Hi."], ["there", "now?!"], ["ok…"], ["go"]])
+
+    def test_non_vocal_words_are_dropped_before_grouping(self):
+        words = make_words([("a", 0.0, 0.2, "A"), (".", 0.2, 0.3, "A"), ("b", 0.3, 0.5, "A")])
+        segments = self.assertMatchesReference(words)
+        self.assertEqual(texts(segments), [["a", "b"]])
+
+    def test_max_words_split(self):
+        words = make_words([(f"w{i}", i * 0.1, i * 0.1 + 0.1, "A") for i in range(10)])
+        segments = self.assertMatchesReference(words, max_words=4)
+        self.assertEqual([len(seg) for seg in segments], [4, 4, 2])
+
+    def test_max_duration_split(self):
+        words = make_words([(f"w{i}", i * 0.5, i * 0.5 + 0.5, "A") for i in range(6)])
+        segments = self.assertMatchesReference(words, max_duration=1.0)
+        self.assertEqual([len(seg) for seg in segments], [2, 2, 2])
+
+    def test_walls_restart_inside_a_gap_run(self):
+        # max_words/max_duration counters must restart at every gap/speaker/punctuation split
+        words = make_words([("a", 0.0, 0.4, "A"), ("b", 0.4, 0.8, "A"), ("c.", 0.8, 1.2, "A"),
+                            ("d", 1.2, 1.6, "A"), ("e", 1.6, 2.0, "A"), ("f", 2.0, 2.4, "A")])
+        self.assertMatchesReference(words, max_words=2, max_duration=1.0)
+
+    def test_randomized_against_reference(self):
+        rng = random.Random(1234)
+        vocab = ["a", "b.", "c?", "d", "e!", "…", "f", ".", "g…", "h"]
+        for _ in range(300):
+            t = 0.0
+            words = []
+            for _ in range(rng.randint(1, 40)):
+                t += rng.choice([0.0, 0.05, 0.2, 0.3, 0.8])
+                dur = rng.uniform(0.05, 0.9)
+                words.append({"word": rng.choice(vocab), "start": t, "end": t + dur,
+                              "speaker": rng.choice(["A", "A", "B", None])})
+                t += dur
+            self.assertMatchesReference(words, pause_threshold=rng.choice([0.1, 0.25, 0.5]),
+                                        max_words=rng.randint(1, 8), max_duration=rng.choice([0.5, 1.5, 3.0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import math
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+
+from create_voice_metadata import CATEGORICAL_COLUMNS, METADATA_COLUMNS, OUTPUT_FILES, MetadataWriter
+
+
+def make_frame(rows):
+    df = pd.DataFrame(rows, columns=list(METADATA_COLUMNS))
+    for col in CATEGORICAL_COLUMNS:
+        df[col] = df[col].astype("category")
+    return df
+
+
+# Two datasets with different label vocabularies, so each table carries its own dictionary
+DATASET_A = [
+    ("/a/1.wav", 'She said "hi", then left', "s1", "happy", "en", "crema_d", 1.5, 16000, None),
+    (None, "dropped: no audio path", "s1", "happy", "en", "crema_d", 2.0, 16000, None),
+    ("/a/2.wav", None, "s2", "neutral", "en", "crema_d", None, None, "no header"),
+]
+DATASET_B = [
+    ("/b/1.flac", "line one\nline two", "s3", "angry", "ja", "jvnv", 3.25, 48000, None),
+]
+EXPECTED_ROWS = [row for row in DATASET_A + DATASET_B if row[0] is not None]
+
+
+def normalize(df):
+    """Rows as plain tuples, with NaN/NA mapped to None and labels as str."""
+    rows = []
+    for record in df[list(METADATA_COLUMNS)].astype(object).itertuples(index=False):
+        row = []
+        for name, value in zip(METADATA_COLUMNS, record):
+            if value is None or (isinstance(value, float) and math.isnan(value)) or value is pd.NA:
+                row.append(None)
+            elif name == "sample_rate":
+                row.append(int(value))
+            elif name == "duration":
+                row.append(float(value))
+            else:
+                row.append(str(value))
+        rows.append(tuple(row))
+    return rows
+
+
+READERS = {
+    "parquet": pd.read_parquet,
+    "feather": pd.read_feather,
+    "csv": pd.read_csv,
+}
+
+
+class TestMetadataWriter(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def write_all(self, fmt):
+        writer = MetadataWriter(self.output_dir, fmt)
+        writer.write(make_frame(DATASET_A))
+        writer.write(make_frame(DATASET_B))
+        writer.close()
+        return writer
+
+    def assertSummary(self, writer):
+        summary = writer.summary()
+        self.assertEqual(summary["total_files"], 3)
+        self.assertEqual(summary["datasets"], {"crema_d": 2, "jvnv": 1})
+        self.assertEqual(summary["emotions"], {"happy": 1, "neutral": 1, "angry": 1})
+        self.assertEqual(summary["languages"], {"en": 2, "ja": 1})
+        self.assertEqual(summary["speakers_count"], 3)
+        self.assertEqual(summary["average_duration_seconds"], round((1.5 + 3.25) / 2, 2))
+
+    def test_every_format_round_trips(self):
+        for fmt in OUTPUT_FILES:
+            with self.subTest(fmt=fmt):
+                writer = self.write_all(fmt)
+                self.assertEqual(writer.output_path, self.output_dir / OUTPUT_FILES[fmt])
+                df = READERS[fmt](writer.output_path)
+                self.assertEqual(list(df.columns), list(METADATA_COLUMNS))
+                self.assertEqual(normalize(df), EXPECTED_ROWS)
+                self.assertSummary(writer)
+
+    def test_binary_formats_keep_labels_dictionary_encoded(self):
+        import pyarrow.feather as feather
+        import pyarrow.parquet as pq
+
+        for table in (pq.read_table(self.write_all("parquet").output_path),
+                      feather.read_table(self.write_all("feather").output_path)):
+            for col in CATEGORICAL_COLUMNS:
+                self.assertTrue(str(table.schema.field(col).type).startswith("dictionary"))
+            self.assertEqual(str(table.schema.field("sample_rate").type), "int64")
+
+    def test_falls_back_to_pandas_csv_without_pyarrow(self):
+        with patch.dict(sys.modules, {"pyarrow": None}):
+            writer = self.write_all("parquet")
+        self.assertEqual(writer.format, "csv")
+        self.assertEqual(writer.output_path, self.output_dir / OUTPUT_FILES["csv"])
+        self.assertFalse((self.output_dir / OUTPUT_FILES["parquet"]).exists())
+        self.assertEqual(normalize(pd.read_csv(writer.output_path)), EXPECTED_ROWS)
+        self.assertSummary(writer)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+import api.server as server
+from api.auth import API_KEY_NAME, _EXPECTED_KEY
+
+
+class FakeOrchestrator:
+    def __init__(self):
+        self.calls = []
+        self.provider = "gemini"
+
+    def bind(self, audio_path=None):
+        return self
+
+    async def refactor_line(self, text, target_syllables, style):
+        self.calls.append((text, target_syllables, style))
+        return {"text": f"{text}#{len(self.calls)}", "provider": self.provider}
+
+
+class TestRefactorCache(unittest.TestCase):
+    def setUp(self):
+        server._refactor_cache.clear()
+        self.orch = FakeOrchestrator()
+        server.app.state.orch = self.orch
+        self.client = TestClient(server.app)
+
+    def tearDown(self):
+        server._refactor_cache.clear()
+        del server.app.state.orch
+
+    def refactor(self, text="hello", target_syllables=5, **extra):
+        response = self.client.post("/api/refactor", json={"text": text, "target_syllables": target_syllables, **extra},
+                                    headers={API_KEY_NAME: _EXPECTED_KEY})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_repeat_request_is_served_from_cache(self):
+        first = self.refactor()
+        second = self.refactor()
+        self.assertEqual(first, {"text": "hello#1", "engine": "gemini"})
+        self.assertEqual(second, first)
+        self.assertEqual(len(self.orch.calls), 1)
+
+    def test_every_request_field_is_part_of_the_key(self):
+        self.refactor()
+        self.refactor(text="other")
+        self.refactor(target_syllables=6)
+        self.refactor(style="Drama")
+        self.refactor(engine="gemini")
+        self.assertEqual(len(self.orch.calls), 5)
+
+    def test_error_results_are_not_cached(self):
+        self.orch.provider = "error"
+        self.refactor()
+        self.refactor()
+        self.assertEqual(len(self.orch.calls), 2)
+
+    def test_entries_expire_after_ttl(self):
+        with patch.object(server.time, "monotonic", return_value=1000.0):
+            self.refactor()
+        with patch.object(server.time, "monotonic", return_value=1000.0 + server.REFACTOR_CACHE_TTL - 1):
+            self.refactor()
+        self.assertEqual(len(self.orch.calls), 1)
+        with patch.object(server.time, "monotonic", return_value=1000.0 + server.REFACTOR_CACHE_TTL + 1):
+            self.assertEqual(self.refactor()["text"], "hello#2")
+        self.assertEqual(len(self.orch.calls), 2)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        with patch.object(server, "REFACTOR_CACHE_SIZE", 2):
+            self.refactor(text="a")
+            self.refactor(text="b")
+            self.refactor(text="a")  # refresh "a" so "b" is the oldest
+            self.refactor(text="c")
+            self.assertEqual(len(self.orch.calls), 3)
+            self.refactor(text="a")
+            self.assertEqual(len(self.orch.calls), 3)
+            self.refactor(text="b")
+            self.assertEqual(len(self.orch.calls), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
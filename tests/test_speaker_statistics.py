@@ -0,0 +1,69 @@
+import random
+import unittest
+
+from diarize import get_speaker_statistics
+
+
+def reference_speaker_statistics(segments):
+    """The original dict loop, kept as the behavioral reference."""
+    if not segments:
+        return {"total_speakers": 0, "total_duration": 0.0, "speaker_durations": {}}
+    speaker_durations = {}
+    total_duration = 0.0
+    for segment in segments:
+        speaker = segment["speaker"]
+        duration = segment["end"] - segment["start"]
+        speaker_durations[speaker] = speaker_durations.get(speaker, 0.0) + duration
+        total_duration += duration
+    return {
+        "total_speakers": len(speaker_durations),
+        "total_duration": round(total_duration, 2),
+        "speaker_durations": {k: round(v, 2) for k, v in speaker_durations.items()}
+    }
+
+
+def seg(start, end, speaker):
+    return {"start": start, "end": end, "speaker": speaker}
+
+
+class TestGetSpeakerStatistics(unittest.TestCase):
+    def assertMatchesReference(self, segments):
+        actual = get_speaker_statistics(segments)
+        expected = reference_speaker_statistics(segments)
+        self.assertEqual(actual, expected)
+        # Speakers are reported in order of first appearance
+        self.assertEqual(list(actual["speaker_durations"]), list(expected["speaker_durations"]))
+        return actual
+
+    def test_empty(self):
+        self.assertEqual(get_speaker_statistics([]), {"total_speakers": 0, "total_duration": 0.0, "speaker_durations": {}})
+
+    def test_first_appearance_order(self):
+        stats = self.assertMatchesReference([seg(0, 1, "SPEAKER_02"), seg(1, 3, "SPEAKER_00"), seg(3, 3.5, "SPEAKER_02")])
+        self.assertEqual(stats["speaker_durations"], {"SPEAKER_02": 1.5, "SPEAKER_00": 2.0})
+        self.assertEqual(stats["total_speakers"], 2)
+        self.assertEqual(stats["total_duration"], 3.5)
+
+    def test_none_speaker_labels(self):
+        stats = self.assertMatchesReference([seg(0, 1, None), seg(1, 2, None)])
+        self.assertEqual(stats["speaker_durations"], {None: 2.0})
+
+    def test_mixed_speaker_label_types(self):
+        stats = self.assertMatchesReference([seg(0, 1, "A"), seg(1, 2.5, None), seg(2.5, 3, 7), seg(3, 4, "A"), seg(4, 4.25, None)])
+        self.assertEqual(stats["speaker_durations"], {"A": 2.0, None: 1.75, 7: 0.5})
+
+    def test_randomized_against_reference(self):
+        rng = random.Random(7)
+        labels = ["SPEAKER_00", "SPEAKER_01", "UNKNOWN", None, 3]
+        for _ in range(200):
+            t = 0.0
+            segments = []
+            for _ in range(rng.randint(1, 60)):
+                start = t + rng.choice([0.0, 0.1, 0.37])
+                t = start + rng.uniform(0.05, 4.0)
+                segments.append(seg(start, t, rng.choice(labels)))
+            self.assertMatchesReference(segments)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import sonora.core.orchestrator as orchestrator
+from sonora.core.orchestrator import SonoraOrchestrator
+
+
+class RecordingTranslator:
+    """Stands in for HardenedTranslator and records how many batches overlap."""
+    def __init__(self, provider, concurrency_mode="burst", mock_mode=False):
+        self.provider = provider
+        self.concurrency_mode = concurrency_mode
+        self.mock_mode = mock_mode
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def translate_batch(self, prompts):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.05)
+        with self._lock:
+            self.in_flight -= 1
+        return [{"text": f"T{i}", "provider": self.provider} for i in range(len(prompts))]
+
+
+def run_batches(translator, n_segments=200):
+    orch = object.__new__(SonoraOrchestrator)
+    orch.translator = translator
+    orch.status_callback = None
+    segments = [[{"word": "こんにちは", "start": 0.0, "end": 1.0}] for _ in range(n_segments)]
+    texts = ["こんにちは"] * n_segments
+    with patch.object(orchestrator, "TRANSLATE_CONCURRENCY", 4):
+        result = asyncio.run(orch.translate_segments_batch(segments, texts=texts))
+    return result
+
+
+class TestTranslateConcurrency(unittest.TestCase):
+    def test_burst_providers_overlap_batches(self):
+        translator = RecordingTranslator("groq")
+        result = run_batches(translator)
+        self.assertEqual(len(result), 200)
+        self.assertGreater(translator.max_in_flight, 1)
+        self.assertLessEqual(translator.max_in_flight, 4)
+
+    def test_self_pacing_and_local_providers_run_one_batch_at_a_time(self):
+        for provider in ("gemini", "local_qwen"):
+            with self.subTest(provider=provider):
+                translator = RecordingTranslator(provider)
+                self.assertEqual(len(run_batches(translator)), 200)
+                self.assertEqual(translator.max_in_flight, 1)
+
+    def test_conservative_mode_runs_one_batch_at_a_time(self):
+        translator = RecordingTranslator("openai", concurrency_mode="conservative")
+        run_batches(translator)
+        self.assertEqual(translator.max_in_flight, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
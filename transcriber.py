@@ -29,9 +29,11 @@ class Transcriber:
         self.model_size = model_size
         self.device = "cuda" if (HAS_TORCH and torch.cuda.is_available()) else "cpu"
         self.use_mock = os.getenv("SONORA_MOCK_MODE", "false").lower() == "true"
+        # CTranslate2 quantization: int8 on CPU, int8 weights + fp16 activations on CUDA
+        self.compute_type = os.getenv("SONORA_WHISPER_COMPUTE") or ("int8_float16" if self.device == "cuda" else "int8")
         self._model = None
         
-        logger.info(f"Initialized Transcriber (Model: {model_size}, Device: {self.device})")
+        logger.info(f"Initialized Transcriber (Model: {model_size}, Device: {self.device}, Compute: {self.compute_type})")
 
     def _load_model(self):
         if self._model is None:
@@ -41,7 +43,7 @@ class Transcriber:
             self._model = WhisperModel(
                 self.model_size, 
                 device=self.device, 
-                compute_type="float16" if self.device == "cuda" else "int8", 
+                compute_type=self.compute_type, 
                 download_root=model_path
             )
 